@@ -1,80 +1,186 @@
 import csv
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, time
 try:
     import matplotlib.pyplot as plt
 except ImportError:
     plt = None
     print("matplotlib not installed. Install with:\n  python -m pip install matplotlib")
 
+# Non-ISO date layouts, tried after datetime.fromisoformat.
+DATE_FORMATS = ["%d-%m-%Y", "%d/%m/%Y", "%Y/%m/%d", "%m/%d/%Y", "%d-%m-%Y %H:%M", "%d/%m/%Y %H:%M"]
+
+
+def parse_date(value):
+    """Parse a Date cell (or a date/datetime) into a datetime; None if it can't be read."""
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    text = (value or "").strip()
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+def _no_bound(value):
+    return value is None or value == ""
+
 
 class AirQualityVisualizer:
     def __init__(self):
         self.data = []
+        # Built by load_data: readings sorted by timestamp, overall and per
+        # city (lower-case name -> (timestamps, rows)), so date ranges are
+        # found by binary search.
+        self.times = []
+        self.rows_by_time = []
+        self.by_city = {}
+        self.undated = 0
 
     def load_data(self, file_name):
         try:
             with open(file_name, "r") as f:
                 reader = csv.DictReader(f)
                 self.data = list(reader)
+            self.build_index()
             print("✅ Data loaded successfully!")
+            if self.undated:
+                print(f"⚠ {self.undated} rows have no readable Date or City and are left out of date ranges.")
         except FileNotFoundError:
             print("❌ Error: CSV file not found!")
         except Exception as e:
             print("❌ Unexpected Error:", e)
 
-    def preview(self, count=5):
+    def build_index(self):
+        """Parse every Date once and sort the readings by time, overall and per city."""
+        dated = []
+        parsed = {}  # each distinct Date string is parsed once (many cities share a day)
+        for row in self.data:
+            text = row.get("Date")
+            ts = parsed.get(text)
+            if ts is None and text not in parsed:
+                ts = parsed[text] = parse_date(text)
+            if ts is not None and row.get("City") is not None:
+                dated.append((ts, row))
+        self.undated = len(self.data) - len(dated)
+        dated.sort(key=lambda item: item[0])  # stable: same-time rows keep file order
+        self.times = [ts for ts, _ in dated]
+        self.rows_by_time = [row for _, row in dated]
+        self.by_city = {}
+        for ts, row in dated:
+            times, rows = self.by_city.setdefault(row["City"].strip().lower(), ([], []))
+            times.append(ts)
+            rows.append(row)
+
+    @staticmethod
+    def _bound(value, upper):
+        ts = parse_date(value)
+        if ts is None:
+            raise ValueError(f"Unreadable date: {value!r}")
+        # A date-only end bound covers the whole day.
+        if upper and not isinstance(value, datetime) and (isinstance(value, date) or len(value.strip()) <= 10):
+            ts = datetime.combine(ts.date(), time.max)
+        return ts
+
+    def _slice(self, city=None, start=None, end=None):
+        if city is None:
+            times, rows = self.times, self.rows_by_time
+        else:
+            times, rows = self.by_city.get(city.strip().lower(), ([], []))
+        lo = 0 if _no_bound(start) else bisect_left(times, self._bound(start, upper=False))
+        hi = len(times) if _no_bound(end) else bisect_right(times, self._bound(end, upper=True))
+        return times[lo:hi], rows[lo:hi]
+
+    def select(self, city=None, start=None, end=None):
+        """Readings (all cities, or one) with start <= Date <= end, oldest first.
+
+        Bounds may be date strings, dates or datetimes and either may be left
+        out. Costs O(log n + k) for k matching readings.
+        """
+        return self._slice(city, start, end)[1]
+
+    @staticmethod
+    def _range_label(start, end):
+        if _no_bound(start) and _no_bound(end):
+            return ""
+        return f" from {start or 'the start'} to {end or 'the end'}"
+
+    def preview(self, count=5, start=None, end=None):
         if not self.data:
             print("⚠ Load data first!")
             return
-        print(f"\nShowing first {count} records:")
-        for row in self.data[:count]:
+        if _no_bound(start) and _no_bound(end):
+            rows = self.data[:count]
+        else:
+            rows = self.select(start=start, end=end)[:count]
+        print(f"\nShowing first {count} records{self._range_label(start, end)}:")
+        for row in rows:
             print(row)
 
-    def filter_by_city(self, city):
-        result = [row for row in self.data if row["City"].lower() == city.lower()]
+    def filter_by_city(self, city, start=None, end=None):
+        result = self.select(city, start, end)
         if result:
-            print(f"\n✅ Records for {city}:")
+            print(f"\n✅ Records for {city}{self._range_label(start, end)}:")
             for r in result[:5]:
                 print(r)
+        elif city.strip().lower() in self.by_city:
+            print("❌ No records for that city in this date range!")
         else:
             print("❌ City not found in data!")
+        return result
 
-    def show_summary(self):
+    def show_summary(self, start=None, end=None):
         if not self.data:
             print("⚠ Load data first!")
             return
-        
+
+        rows = self.data if _no_bound(start) and _no_bound(end) else self.select(start=start, end=end)
         try:
-            aqis = [int(row["AQI"]) for row in self.data]
-            print("\n📊 AQI Summary:")
+            aqis = [int(row["AQI"]) for row in rows]
+            print(f"\n📊 AQI Summary{self._range_label(start, end)}:")
             print(f"Max AQI: {max(aqis)}")
             print(f"Min AQI: {min(aqis)}")
             print(f"Avg AQI: {sum(aqis)/len(aqis):.2f}")
         except:
             print("❌ Error calculating statistics")
 
-    def plot_city(self, city):
-     def plot_city(self, city):
+    def plot_city(self, city, start=None, end=None):
         if plt is None:
             print("❌ matplotlib not available. Install with:\n  python -m pip install matplotlib")
             return
 
-        filtered = [row for row in self.data if row["City"].lower() == city.lower()]
-        if not filtered:
+        if city.strip().lower() not in self.by_city:
             print("❌ City not found!")
             return
-        
-        days = [row["Date"] for row in filtered]
+        days, filtered = self._slice(city, start, end)
+        if not filtered:
+            print("❌ No records for that city in this date range!")
+            return
+
         values = [int(row["AQI"]) for row in filtered]
 
         plt.figure()
         plt.plot(days, values, marker='o')
-        plt.title(f"AQI Trend for {city}")
+        plt.title(f"AQI Trend for {city}{self._range_label(start, end)}")
         plt.xlabel("Date")
         plt.ylabel("AQI")
         plt.xticks(rotation=45)
         plt.tight_layout()
         plt.show()
 
+def ask_range():
+    start = input("Start date (YYYY-MM-DD, blank = from the start): ").strip()
+    end = input("End date (YYYY-MM-DD, blank = to the end): ").strip()
+    return start or None, end or None
+
 def menu():
     tool = AirQualityVisualizer()
 
@@ -89,21 +195,26 @@ def menu():
 
         ch = input("Enter choice: ")
 
-        if ch == "1":
-            tool.load_data(input("Enter CSV file name: "))
-        elif ch == "2":
-            tool.preview()
-        elif ch == "3":
-            tool.filter_by_city(input("Enter city name: "))
-        elif ch == "4":
-            tool.show_summary()
-        elif ch == "5":
-            tool.plot_city(input("Enter city name: "))
-        elif ch == "0":
-            print("✅ Program closed.")
-            break
-        else:
-            print("❌ Invalid choice!")
+        try:
+            if ch == "1":
+                tool.load_data(input("Enter CSV file name: "))
+            elif ch == "2":
+                tool.preview(5, *ask_range())
+            elif ch == "3":
+                city = input("Enter city name: ")
+                tool.filter_by_city(city, *ask_range())
+            elif ch == "4":
+                tool.show_summary(*ask_range())
+            elif ch == "5":
+                city = input("Enter city name: ")
+                tool.plot_city(city, *ask_range())
+            elif ch == "0":
+                print("✅ Program closed.")
+                break
+            else:
+                print("❌ Invalid choice!")
+        except ValueError as e:
+            print("❌", e)
 
 if __name__ == "__main__":
     menu()
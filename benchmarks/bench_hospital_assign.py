@@ -0,0 +1,95 @@
+"""Benchmark: automatic doctor assignment at hospital-network scale.
+
+Builds a network with --doctors doctors spread over the specializations in
+DISEASE_SPECIALIZATIONS and admits --patients patients with random
+diseases. It times HospitalManagement.assign_pending() (one heap per
+specialization) against a naive pass that scans every doctor of the
+specialization for each patient. It also checks that caseloads within a
+specialization differ by at most one.
+
+    python benchmarks/bench_hospital_assign.py --doctors 5000 --patients 500000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hospital_management import (  # noqa: E402
+    DEFAULT_SPECIALIZATION, DISEASE_SPECIALIZATIONS, Doctor, HospitalManagement, Patient,
+)
+
+
+def build(doctors, patients, seed):
+    rng = random.Random(seed)
+    specs = sorted(set(DISEASE_SPECIALIZATIONS.values()))
+    diseases = sorted(DISEASE_SPECIALIZATIONS) + ["unknown condition"]
+    hms = HospitalManagement()
+    for i in range(doctors):
+        did = f"D{i:06d}"
+        hms.doctors[did] = Doctor(f"Doctor {i}", did, specs[i % len(specs)])
+    for i in range(patients):
+        pid = f"P{i:08d}"
+        hms.patients[pid] = Patient(f"Patient {i}", pid, str(rng.randint(1, 95)), rng.choice(diseases))
+    return hms
+
+
+def naive_assign(hms, patient_ids):
+    """Reference: linear scan over the specialization's doctors per patient."""
+    by_spec = {}
+    for did, d in hms.doctors.items():
+        by_spec.setdefault(d.specialization.lower(), []).append(did)
+    load = dict.fromkeys(hms.doctors, 0)
+    for pid in patient_ids:
+        spec = hms.specialization_for(hms.patients[pid].disease).lower()
+        pool = by_spec.get(spec) or by_spec.get(DEFAULT_SPECIALIZATION.lower())
+        did = min(pool, key=load.__getitem__)
+        load[did] += 1
+    return load
+
+
+def spread(hms, load):
+    by_spec = {}
+    for did, d in hms.doctors.items():
+        by_spec.setdefault(d.specialization, []).append(load[did])
+    return max(max(v) - min(v) for v in by_spec.values())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--doctors", type=int, default=5_000)
+    parser.add_argument("--patients", type=int, default=500_000)
+    parser.add_argument("--naive-patients", type=int, default=20_000,
+                        help="patients for the naive reference (it is O(doctors) per patient)")
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    hms = build(args.doctors, args.patients, args.seed)
+    ids = list(hms.patients)
+
+    start = time.perf_counter()
+    result = hms.assign_pending()
+    heap_s = time.perf_counter() - start
+    loads = hms.caseloads()
+    print(f"heap bulk   {result['assigned']:>10,} patients in {heap_s:7.3f}s "
+          f"({result['assigned'] / heap_s:,.0f}/s), max spread {spread(hms, loads)}")
+
+    sample = ids[:args.naive_patients]
+    start = time.perf_counter()
+    naive_load = naive_assign(hms, sample)
+    naive_s = time.perf_counter() - start
+    print(f"naive scan  {len(sample):>10,} patients in {naive_s:7.3f}s "
+          f"({len(sample) / naive_s:,.0f}/s), max spread {spread(hms, naive_load)}")
+    per_heap = heap_s / max(result["assigned"], 1)
+    per_naive = naive_s / max(len(sample), 1)
+    print(f"per-patient speedup: {per_naive / per_heap:.1f}x with {args.doctors:,} doctors")
+    if spread(hms, loads) > 1:
+        print("FAIL: caseloads within a specialization differ by more than one")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Import-time regression guard for student_analyzer.
+
+Runs ``python -X importtime -c "import student_analyzer"`` in a scratch
+directory several times and checks that
+
+* the module's cumulative import time stays under --max-ms (best run),
+* numpy, pandas and matplotlib are not imported eagerly,
+* no data/ or output/ folders are created as a side effect.
+
+Exits with status 1 when any check fails, so it can gate CI.
+
+    python benchmarks/bench_import_time.py --runs 5 --max-ms 150
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+EAGER_FORBIDDEN = ("numpy", "pandas", "matplotlib")
+
+
+def import_profile(module, cwd):
+    """Return {module name: cumulative microseconds} for one fresh interpreter."""
+    env = dict(os.environ, PYTHONPATH=REPO + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=cwd, env=env, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+    times = {}
+    for line in proc.stderr.splitlines():
+        m = LINE.match(line)
+        if m:
+            times[m.group(4)] = int(m.group(2))
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="student_analyzer")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--max-ms", type=float, default=150.0)
+    args = parser.parse_args(argv)
+
+    failures = []
+    best = None
+    with tempfile.TemporaryDirectory() as scratch:
+        for _ in range(args.runs):
+            times = import_profile(args.module, scratch)
+            total = times.get(args.module, 0) / 1000.0
+            best = total if best is None else min(best, total)
+        eager = sorted(name for name in times if name.split(".")[0] in EAGER_FORBIDDEN)
+        created = sorted(os.listdir(scratch))
+
+    print(f"{args.module}: best of {args.runs} imports = {best:.1f} ms (limit {args.max_ms:.0f} ms)")
+    if best > args.max_ms:
+        failures.append(f"import took {best:.1f} ms > {args.max_ms:.0f} ms")
+    if eager:
+        failures.append(f"heavy modules imported eagerly: {', '.join(eager[:5])}")
+    if created:
+        failures.append(f"import created files/folders: {', '.join(created)}")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if not failures:
+        print("OK")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
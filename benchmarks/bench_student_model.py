@@ -0,0 +1,101 @@
+"""Benchmark: cached Student metrics vs. recomputing them on every call.
+
+Builds N students with a handful of subjects each, then runs the summary
+work the analyzer does per student (to_dict, __str__, sorting by average)
+with the current Student and with a copy of the old recomputing model.
+
+    python benchmarks/bench_student_model.py --students 300000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from student_analyzer import Student  # noqa: E402
+
+SUBJECTS = ["Math", "Physics", "Chemistry", "Biology", "English"]
+
+
+class RecomputingStudent:
+    """The previous Student: total/average/grade rescan marks on every call."""
+    def __init__(self, name, roll_no, gender=None):
+        self.name = name
+        self.roll_no = roll_no
+        self.gender = gender
+        self.marks = {}
+
+    def add_mark(self, subject, marks):
+        self.marks[subject] = float(marks)
+
+    def total(self):
+        return sum(self.marks.values()) if self.marks else 0.0
+
+    def average(self):
+        return self.total() / len(self.marks) if self.marks else 0.0
+
+    def grade(self):
+        avg = self.average()
+        if avg >= 90: return "A+"
+        if avg >= 80: return "A"
+        if avg >= 70: return "B"
+        if avg >= 60: return "C"
+        if avg >= 50: return "D"
+        return "F"
+
+    def to_dict(self):
+        d = {"Name": self.name, "Roll_No": self.roll_no, "Gender": self.gender,
+             "Total": self.total(), "Average": round(self.average(), 2), "Grade": self.grade()}
+        d.update({f"Mark_{sub}": mark for sub, mark in self.marks.items()})
+        return d
+
+    def __str__(self):
+        return f"{self.roll_no} - {self.name} | Avg: {self.average():.2f} | Grade: {self.grade()}"
+
+
+def build(cls, rows):
+    students = []
+    for roll, marks in rows:
+        s = cls(name=f"Student {roll}", roll_no=roll, gender="F")
+        for subject, mark in zip(SUBJECTS, marks):
+            s.add_mark(subject, mark)
+        students.append(s)
+    return students
+
+
+def summarize(students):
+    rows = [s.to_dict() for s in students]
+    lines = [str(s) for s in students]
+    ranked = sorted(students, key=lambda s: s.average(), reverse=True)
+    return len(rows) + len(lines) + len(ranked)
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    rows = [(f"R{i:07d}", [rng.randint(0, 100) for _ in SUBJECTS]) for i in range(args.students)]
+
+    results = {}
+    for label, cls in (("recomputing", RecomputingStudent), ("cached", Student)):
+        students, build_s = timed(build, cls, rows)
+        _, summary_s = timed(summarize, students)
+        results[label] = (build_s, summary_s)
+        print(f"{label:<12} build {build_s:7.3f}s   summaries {summary_s:7.3f}s")
+    speedup = results["recomputing"][1] / results["cached"][1]
+    print(f"summary speedup: {speedup:.2f}x over {args.students:,} students")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""Benchmark suite: every tool's hot paths on seeded synthetic data.
+
+Generates data at the chosen scale in a scratch directory, times each hot
+path headlessly (Agg backend, tool output swallowed), writes the results
+to JSON and compares them with a stored baseline for the same scale.
+
+    python benchmarks/bench_suite.py --scale 10k
+    python benchmarks/bench_suite.py --scale 1m --save-baseline
+    python benchmarks/bench_suite.py --scale 1m --only library,students
+
+Scales are 10k, 1m and 10m records per dataset (or --rows N). The 10m
+scale keeps every record in memory as the tools do, so it needs a machine
+with plenty of RAM. Exits with status 1 when a timing is slower than the
+baseline by more than --tolerance.
+"""
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+os.environ.setdefault("MPLBACKEND", "Agg")
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO)
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+SUITES = ("aqi", "hospital", "library", "students")
+CITIES = ["Delhi", "Mumbai", "Kolkata", "Chennai", "Bengaluru", "Hyderabad", "Pune", "Ahmedabad",
+          "Jaipur", "Lucknow", "Kanpur", "Nagpur", "Indore", "Bhopal", "Patna", "Agra"]
+SUBJECTS = ["Math", "Physics", "Chemistry", "Biology", "English"]
+WORDS = ["Python", "Data", "Systems", "Algorithms", "Networks", "Theory", "Design", "Advanced",
+         "Modern", "Applied", "Introduction", "Databases", "Compilers", "Graphics", "Security"]
+
+
+# -------------------------
+# Seeded generators
+# -------------------------
+def gen_aqi_csv(path, rows, rng):
+    """City, Date, AQI readings: one per city per day until rows are written."""
+    start = date(2000, 1, 1)
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["City", "Date", "AQI"])
+        for i in range(rows):
+            day = start + timedelta(days=i // len(CITIES))
+            writer.writerow([CITIES[i % len(CITIES)], day.isoformat(), rng.randint(10, 450)])
+    return start, start + timedelta(days=(rows - 1) // len(CITIES))
+
+
+def gen_hospital(rows, rng):
+    """HospitalManagement with `rows` admitted patients and one doctor per 100."""
+    from hospital_management import DISEASE_SPECIALIZATIONS, Doctor, HospitalManagement, Patient
+    specs = sorted(set(DISEASE_SPECIALIZATIONS.values()))
+    diseases = sorted(DISEASE_SPECIALIZATIONS)
+    hms = HospitalManagement()
+    for i in range(max(len(specs), rows // 100)):
+        did = f"D{i:07d}"
+        hms.doctors[did] = Doctor(f"Doctor {i}", did, specs[i % len(specs)])
+    for i in range(rows):
+        pid = f"P{i:08d}"
+        hms.patients[pid] = Patient(f"Patient {i} {rng.choice(WORDS)}", pid,
+                                    str(rng.randint(1, 95)), rng.choice(diseases))
+    return hms
+
+
+def gen_catalog_csv(path, rows, rng):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["book_id", "title", "author", "copies"])
+        for i in range(rows):
+            title = " ".join(rng.sample(WORDS, 3))
+            writer.writerow([f"B{i:08d}", title, f"Author {rng.randrange(rows // 20 + 1)}", rng.randint(1, 5)])
+
+
+def gen_loans_csv(path, rows, books, rng):
+    """Borrow/return stream; all but the last ~1000 loans are returned later in the log."""
+    students = max(10, rows // 10)
+    out = []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["op", "book_id", "title", "author", "copies", "student"])
+        for _ in range(rows // 2):
+            loan = (f"B{rng.randrange(books):08d}", f"Student {rng.randrange(students)}")
+            out.append(loan)
+            writer.writerow(["borrow", loan[0], "", "", "", loan[1]])
+            if len(out) > 1000:
+                book_id, student = out.pop(rng.randrange(len(out)))
+                writer.writerow(["return", book_id, "", "", "", student])
+
+
+def gen_marks_csv(path, rows, rng):
+    """Long-format mark sheet: one row per student per subject."""
+    with open(path, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Roll_No", "Gender", "Subject", "Marks", "Attendance", "Semester"])
+        for i in range(rows // len(SUBJECTS)):
+            name, roll = f"Student {i}", f"R{i:08d}"
+            gender = "MF"[i % 2]
+            attendance = rng.randint(40, 100)
+            semester = 1 + i % 8
+            for subject in SUBJECTS:
+                writer.writerow([name, roll, gender, subject, rng.randint(0, 100), attendance, semester])
+
+
+# -------------------------
+# Timing helpers
+# -------------------------
+class Recorder:
+    def __init__(self):
+        self.results = {}
+
+    def time(self, name, fn, *args, rows=None, **kwargs):
+        """Run fn once with its printed output swallowed and record the wall time."""
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = fn(*args, **kwargs)
+            seconds = time.perf_counter() - start
+        entry = {"seconds": round(seconds, 6)}
+        if rows is not None:
+            entry["rows"] = rows
+            entry["rows_per_s"] = round(rows / seconds) if seconds > 0 else None
+        self.results[name] = entry
+        print(f"  {name:<32} {seconds:9.3f}s" + (f"  {rows:>12,} rows" if rows is not None else ""))
+        return result
+
+
+# -------------------------
+# Suites
+# -------------------------
+def bench_aqi(rec, rows, workdir, rng):
+    from AirQualityVisualizer import AirQualityVisualizer
+    path = os.path.join(workdir, "aqi.csv")
+    first, last = gen_aqi_csv(path, rows, rng)
+    tool = AirQualityVisualizer()
+    rec.time("aqi.load", tool.load_data, path, rows=rows)
+    week = [(first + timedelta(days=rng.randrange(max(1, (last - first).days)))) for _ in range(1000)]
+    rec.time("aqi.range_query_x1000",
+             lambda: [tool.select(rng.choice(CITIES), d, d + timedelta(days=6)) for d in week])
+    rec.time("aqi.filter_by_city", tool.filter_by_city, "Delhi", rows=rows // len(CITIES))
+    rec.time("aqi.summary", tool.show_summary, rows=rows)
+    mid = first + (last - first) / 2
+    rec.time("aqi.summary_range", tool.show_summary, mid, last)
+
+
+def bench_hospital(rec, rows, workdir, rng):
+    hms = rec.time("hospital.generate", gen_hospital, rows, rng, rows=rows)
+    rec.time("hospital.assign_pending", hms.assign_pending, rows=rows)
+    keyword = "algorithms"
+    # same scan as the interactive search_patient
+    rec.time("hospital.search", lambda: [p for p in hms.patients.values()
+                                         if keyword in p.unique_id.lower() or keyword in p.name.lower()],
+             rows=rows)
+    hms.data_file = Path(workdir) / "hospital_records.json"
+    rec.time("hospital.save", hms.save_data, rows=rows)
+    rec.time("hospital.load", hms.load_data, rows=rows)
+
+
+def reset_library(library):
+    library.books.clear()
+    library.borrowed.clear()
+    library.student_names.clear()
+    library.holds.clear()
+    library.held.clear()
+    library.reset_views()
+    library.reset_stats()
+
+
+def bench_library(rec, rows, workdir, rng):
+    import library
+    reset_library(library)
+    catalog_csv = os.path.join(workdir, "books.csv")
+    loans_csv = os.path.join(workdir, "loans.csv")
+    gen_catalog_csv(catalog_csv, rows, rng)
+    gen_loans_csv(loans_csv, rows, rows, rng)
+    rec.time("library.bulk_load", library.bulk_load_books, catalog_csv,
+             os.path.join(workdir, "books_rejects.csv"), rows=rows)
+    rec.time("library.load_books", library.load_books_from_csv, catalog_csv, rows=rows)
+    keyword = "compilers"
+    # same scan as the interactive search_book (title keyword)
+    rec.time("library.search_title", lambda: [bid for bid, info in library.books.items()
+                                              if keyword in info.get("title", "").lower()], rows=rows)
+    rec.time("library.sorted_page", library.books_page, "title", 1, 20, rows=rows)
+    rec.time("library.borrow_return_batch", library.run_batch, loans_csv, rows=rows)
+    rec.time("library.save_books", library.save_books_to_csv, os.path.join(workdir, "books_out.csv"), rows=rows)
+    rec.time("library.save_borrowed", library.save_borrowed_to_csv, os.path.join(workdir, "borrowed.csv"))
+    rec.time("library.load_borrowed", library.load_borrowed_from_csv, os.path.join(workdir, "borrowed.csv"))
+    reset_library(library)
+
+
+def bench_students(rec, rows, workdir, rng):
+    import student_analyzer as sa
+    sa.configure_paths(root=workdir)
+    path = os.path.join(workdir, "marks.csv")
+    gen_marks_csv(path, rows, rng)
+    manager = sa.StudentManager()
+    rec.time("students.load_csv", manager.load_csv, path, rows=rows)
+    rec.time("students.build_students", manager.build_students, rows=rows)
+    rec.time("students.top_bottom", manager.top_bottom_performers, 10)
+    rec.time("students.subject_wise_stats", manager.subject_wise_stats, rows=rows)
+    rec.time("students.export_outputs", sa.export_outputs, manager, rows=rows)
+    rec.time("students.dashboard_export", sa.create_dashboard, manager, rows=len(manager.summary))
+
+
+BENCHES = {"aqi": bench_aqi, "hospital": bench_hospital, "library": bench_library, "students": bench_students}
+
+
+# -------------------------
+# Baseline comparison
+# -------------------------
+def compare(results, baseline, tolerance, min_seconds):
+    """Print current vs baseline per timing; return the names that regressed.
+
+    Timings under min_seconds in both runs are too noisy to flag.
+    """
+    regressions = []
+    old = baseline.get("results", {})
+    print(f"\nvs baseline from {baseline.get('generated_at', '?')} (tolerance {tolerance:.0%}):")
+    for name, entry in results.items():
+        if name not in old or not old[name]["seconds"]:
+            print(f"  {name:<32} (no baseline)")
+            continue
+        ratio = entry["seconds"] / old[name]["seconds"]
+        flag = ""
+        if ratio > 1 + tolerance and entry["seconds"] >= min_seconds:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"  {name:<32} {old[name]['seconds']:9.3f}s -> {entry['seconds']:9.3f}s  x{ratio:5.2f}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", choices=sorted(SCALES), default="10k")
+    parser.add_argument("--rows", type=int, help="override the scale's record count")
+    parser.add_argument("--only", default=",".join(SUITES), help=f"comma list of {', '.join(SUITES)}")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--baseline", help="baseline JSON (default: benchmarks/baseline_<scale>.json)")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown before failing")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="never flag timings shorter than this")
+    parser.add_argument("--workdir", help="where to generate data (default: a temp dir)")
+    args = parser.parse_args(argv)
+
+    rows = args.rows or SCALES[args.scale]
+    suites = [name.strip() for name in args.only.split(",") if name.strip()]
+    unknown = [name for name in suites if name not in BENCHES]
+    if unknown:
+        parser.error(f"unknown suite(s): {', '.join(unknown)}")
+    label = args.scale if not args.rows else str(args.rows)
+    baseline_path = args.baseline or os.path.join(REPO, "benchmarks", f"baseline_{label}.json")
+
+    rec = Recorder()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = args.workdir or tmp
+        os.makedirs(workdir, exist_ok=True)
+        for name in suites:
+            print(f"[{name}] {rows:,} records")
+            BENCHES[name](rec, rows, workdir, random.Random(args.seed))
+
+    report = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "scale": label,
+        "rows": rows,
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "results": rec.results,
+    }
+    with open(args.out, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.out}")
+
+    status = 0
+    if os.path.exists(baseline_path):
+        with open(baseline_path) as f:
+            baseline = json.load(f)
+        if baseline.get("rows") != rows:
+            print(f"Baseline {baseline_path} is for {baseline.get('rows')} rows; not comparing.")
+        elif compare(rec.results, baseline, args.tolerance, args.min_seconds):
+            status = 1
+    else:
+        print(f"No baseline at {baseline_path} (store one with --save-baseline).")
+    if args.save_baseline:
+        with open(baseline_path, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
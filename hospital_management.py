@@ -1,5 +1,7 @@
 
 from pathlib import Path
+from itertools import count
+import heapq
 import json
 
 # -------------------------
@@ -59,6 +61,118 @@ class Doctor(Person):
         }
 
 
+# -------------------------
+# Automatic Doctor Assignment
+# -------------------------
+DEFAULT_SPECIALIZATION = "General Medicine"
+
+# disease (lower case) -> specialization; extend or replace it with
+# HospitalManagement.load_specialization_table().
+DISEASE_SPECIALIZATIONS = {
+    "fever": "General Medicine", "flu": "General Medicine", "cold": "General Medicine",
+    "cough": "General Medicine", "typhoid": "General Medicine", "malaria": "General Medicine",
+    "dengue": "General Medicine",
+    "heart attack": "Cardiology", "chest pain": "Cardiology", "hypertension": "Cardiology",
+    "arrhythmia": "Cardiology", "heart failure": "Cardiology",
+    "fracture": "Orthopedics", "arthritis": "Orthopedics", "back pain": "Orthopedics",
+    "sprain": "Orthopedics",
+    "asthma": "Pulmonology", "pneumonia": "Pulmonology", "tuberculosis": "Pulmonology",
+    "bronchitis": "Pulmonology",
+    "diabetes": "Endocrinology", "thyroid": "Endocrinology",
+    "migraine": "Neurology", "stroke": "Neurology", "epilepsy": "Neurology",
+    "eczema": "Dermatology", "psoriasis": "Dermatology", "skin rash": "Dermatology",
+    "cancer": "Oncology", "tumor": "Oncology",
+    "kidney stone": "Nephrology", "kidney failure": "Nephrology",
+    "depression": "Psychiatry", "anxiety": "Psychiatry",
+}
+
+
+class CaseloadBalancer:
+    """Least-loaded doctor per specialization.
+
+    One min-heap of (caseload, seq, doctor_id) per specialization. A change in
+    caseload pushes a fresh entry and leaves the old one behind; stale entries
+    are skipped when they reach the top, so picking and updating a doctor are
+    both O(log n).
+    """
+    def __init__(self):
+        self.load = {}    # doctor_id -> active (admitted) patients
+        self.spec = {}    # doctor_id -> specialization key
+        self.heaps = {}   # specialization key -> heap
+        self.size = {}    # specialization key -> doctors currently in it
+        self._seq = count()
+
+    @staticmethod
+    def key(specialization):
+        return (specialization or "").strip().lower()
+
+    @classmethod
+    def from_records(cls, doctors, patients):
+        balancer = cls()
+        loads = dict.fromkeys(doctors, 0)
+        for p in patients.values():
+            if p.status == "Admitted" and p.doctor_id in loads:
+                loads[p.doctor_id] += 1
+        for did, d in doctors.items():
+            spec = balancer.spec[did] = cls.key(d.specialization)
+            balancer.load[did] = loads[did]
+            balancer.size[spec] = balancer.size.get(spec, 0) + 1
+            balancer.heaps.setdefault(spec, []).append((loads[did], next(balancer._seq), did))
+        for heap in balancer.heaps.values():
+            heapq.heapify(heap)
+        return balancer
+
+    def add_doctor(self, doctor_id, specialization, load=0):
+        # Re-adding a doctor leaves their old heap entries stale.
+        old = self.spec.get(doctor_id)
+        if old is not None:
+            self.size[old] -= 1
+        spec = self.spec[doctor_id] = self.key(specialization)
+        self.load[doctor_id] = load
+        self.size[spec] = self.size.get(spec, 0) + 1
+        heapq.heappush(self.heaps.setdefault(spec, []), (load, next(self._seq), doctor_id))
+
+    def change(self, doctor_id, delta):
+        """Adjust a doctor's caseload by delta (e.g. +1 assign, -1 discharge)."""
+        if doctor_id not in self.load:
+            return
+        self.load[doctor_id] += delta
+        spec = self.spec[doctor_id]
+        heap = self.heaps[spec]
+        heapq.heappush(heap, (self.load[doctor_id], next(self._seq), doctor_id))
+        if len(heap) > 2 * self.size[spec] + 64:
+            self._compact(spec)
+
+    def _compact(self, spec):
+        # Drop stale entries once they outnumber the live ones.
+        best = {}
+        for entry in self.heaps[spec]:
+            did = entry[2]
+            if self.spec.get(did) == spec and entry[0] == self.load[did]:
+                if did not in best or entry[1] > best[did][1]:
+                    best[did] = entry
+        self.heaps[spec] = list(best.values())
+        heapq.heapify(self.heaps[spec])
+
+    def least_loaded(self, specialization):
+        """Doctor ID with the smallest caseload in the specialization, or None."""
+        spec = self.key(specialization)
+        heap = self.heaps.get(spec)
+        while heap:
+            load, _, did = heap[0]
+            if self.spec.get(did) == spec and self.load[did] == load:
+                return did
+            heapq.heappop(heap)
+        return None
+
+    def assign(self, specialization):
+        """Pick the least-loaded doctor and count the new patient against them."""
+        did = self.least_loaded(specialization)
+        if did is not None:
+            self.change(did, 1)
+        return did
+
+
 # -------------------------
 # Hospital Management
 # -------------------------
@@ -67,6 +181,15 @@ class HospitalManagement:
         self.patients = {}
         self.doctors = {}
         self.data_file = Path("hospital_records.json")
+        self.specialization_table = dict(DISEASE_SPECIALIZATIONS)
+        self.table_file = Path("specializations.json")
+        self._balancer = None  # built from the records on first automatic assignment
+
+    @property
+    def balancer(self):
+        if self._balancer is None:
+            self._balancer = CaseloadBalancer.from_records(self.doctors, self.patients)
+        return self._balancer
 
     # -------- Patient Operations ----------
     def add_patient(self):
@@ -101,7 +224,10 @@ class HospitalManagement:
     def discharge_patient(self):
         pid = input("Enter Patient ID to discharge: ").strip()
         if pid in self.patients:
-            self.patients[pid].discharge()
+            p = self.patients[pid]
+            if self._balancer is not None and p.status == "Admitted" and p.doctor_id:
+                self._balancer.change(p.doctor_id, -1)
+            p.discharge()
             print("✅ Patient discharged successfully.")
         else:
             print("✅ Patient ID not found.")
@@ -113,6 +239,8 @@ class HospitalManagement:
         name = input("Enter Doctor Name: ").strip()
         spec = input("Enter Specialization: ").strip()
         self.doctors[did] = Doctor(name, did, spec)
+        if self._balancer is not None:
+            self._balancer.add_doctor(did, spec, self._balancer.load.get(did, 0))
         print("✅ Doctor added successfully.")
 
     def view_doctors(self):
@@ -137,9 +265,116 @@ class HospitalManagement:
             print("Doctor not found.")
             return
 
-        self.patients[pid].assign_doctor(did)
+        self._set_doctor(self.patients[pid], did)
         print("Doctor assigned successfully.")
 
+    def _set_doctor(self, patient, doctor_id):
+        if self._balancer is not None and patient.status == "Admitted":
+            if patient.doctor_id:
+                self._balancer.change(patient.doctor_id, -1)
+            self._balancer.change(doctor_id, 1)
+        patient.assign_doctor(doctor_id)
+
+    # -------- Automatic Assignment ----------
+    def specialization_for(self, disease):
+        """Specialization that treats the disease (DEFAULT_SPECIALIZATION if unknown)."""
+        return self.specialization_table.get((disease or "").strip().lower(), DEFAULT_SPECIALIZATION)
+
+    def auto_assign(self, pid):
+        """Give the patient the least-loaded doctor of the right specialization.
+
+        Falls back to DEFAULT_SPECIALIZATION when no doctor has the matching
+        specialization. Returns the doctor ID, or None if nobody is available.
+        """
+        patient = self.patients[pid]
+        balancer = self.balancer
+        if patient.doctor_id and patient.status == "Admitted":
+            balancer.change(patient.doctor_id, -1)
+            patient.doctor_id = None
+        spec = self.specialization_for(patient.disease)
+        did = balancer.least_loaded(spec)
+        if did is None:
+            did = balancer.least_loaded(DEFAULT_SPECIALIZATION)
+        if did is None:
+            return None
+        if patient.status == "Admitted":
+            balancer.change(did, 1)
+        patient.assign_doctor(did)
+        return did
+
+    def assign_pending(self, patient_ids=None):
+        """Auto-assign every admitted patient without a doctor in one pass.
+
+        patient_ids limits the pass to those patients (e.g. one admission
+        batch). Returns {"assigned": n, "unassigned": [ids]}.
+        """
+        if patient_ids is None:
+            patient_ids = [pid for pid, p in self.patients.items()
+                           if p.status == "Admitted" and not p.doctor_id]
+        balancer = self.balancer
+        spec_for = self.specialization_for
+        fallback = balancer.key(DEFAULT_SPECIALIZATION)
+        assigned, unassigned = 0, []
+        for pid in patient_ids:
+            patient = self.patients[pid]
+            if patient.status != "Admitted" or patient.doctor_id:
+                continue
+            did = balancer.assign(spec_for(patient.disease))
+            if did is None:
+                did = balancer.assign(fallback)
+            if did is None:
+                unassigned.append(pid)
+            else:
+                patient.doctor_id = did
+                assigned += 1
+        return {"assigned": assigned, "unassigned": unassigned}
+
+    def caseloads(self):
+        """Active caseload per doctor ID."""
+        return dict(self.balancer.load)
+
+    def auto_assign_doctor(self):
+        pid = input("Enter Patient ID: ").strip()
+        if pid not in self.patients:
+            print("Patient not found.")
+            return
+        did = self.auto_assign(pid)
+        if did is None:
+            print(f"❌ No doctor available for {self.specialization_for(self.patients[pid].disease)}.")
+        else:
+            d = self.doctors[did]
+            print(f"✅ Assigned {d.name} ({d.specialization}, {self.balancer.load[did]} active patients).")
+
+    def bulk_assign(self):
+        result = self.assign_pending()
+        print(f"✅ {result['assigned']} patients assigned automatically.")
+        if result["unassigned"]:
+            print(f"❌ {len(result['unassigned'])} patients still need a doctor: "
+                  f"{', '.join(result['unassigned'][:10])}{' ...' if len(result['unassigned']) > 10 else ''}")
+
+    def view_caseloads(self):
+        print("\n--- Doctor Caseloads ---")
+        if not self.doctors:
+            print("No doctor data available.")
+            return
+        loads = self.balancer.load
+        print(f"{'ID':<8} {'Name':<20} {'Specialization':<18} {'Active':<6}")
+        print("-" * 56)
+        for did, d in sorted(self.doctors.items(), key=lambda item: (item[1].specialization, -loads[item[0]])):
+            print(f"{d.unique_id:<8} {d.name:<20} {d.specialization:<18} {loads[did]:<6}")
+        print("-" * 56)
+
+    def load_specialization_table(self, path=None):
+        """Merge a JSON {disease: specialization} file into the lookup table."""
+        path = Path(path or self.table_file)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                table = json.load(f)
+            self.specialization_table.update({k.strip().lower(): v for k, v in table.items()})
+            print(f"📂 Loaded {len(table)} disease mappings from {path}.")
+        except Exception as e:
+            print("❌ Error loading specialization table:", e)
+
     # -------- File Handling ----------
     def save_data(self):
         """Save patients and doctors to JSON file."""
@@ -164,8 +399,14 @@ class HospitalManagement:
             with open(self.data_file, "r", encoding="utf-8") as f:
                 data = json.load(f)
             # Reconstruct objects (guard if file format is older/missing fields)
-            self.patients = {pid: Patient(**info) for pid, info in data.get("patients", {}).items()}
+            self.patients = {}
+            for pid, info in data.get("patients", {}).items():
+                info = dict(info)
+                doctor_id = info.pop("doctor_id", None)
+                self.patients[pid] = Patient(**info)
+                self.patients[pid].doctor_id = doctor_id
             self.doctors = {did: Doctor(**info) for did, info in data.get("doctors", {}).items()}
+            self._balancer = None
             print("📂 Data loaded successfully.")
         except Exception as e:
             print("❌ Error loading file:", e)
@@ -185,6 +426,10 @@ def menu():
         print("7. Assign Doctor to Patient")
         print("8. Save Records")
         print("9. Load Records")
+        print("10. Auto-assign Doctor to Patient")
+        print("11. Auto-assign All Unassigned Patients")
+        print("12. View Doctor Caseloads")
+        print("13. Load Disease-Specialization Table")
         print("0. Exit")
         ch = input("Enter choice: ").strip()
         if ch == "1":
@@ -205,6 +450,15 @@ def menu():
             HMS.save_data()
         elif ch == "9":
             HMS.load_data()
+        elif ch == "10":
+            HMS.auto_assign_doctor()
+        elif ch == "11":
+            HMS.bulk_assign()
+        elif ch == "12":
+            HMS.view_caseloads()
+        elif ch == "13":
+            path = input(f"Enter table path (default: {HMS.table_file}): ").strip()
+            HMS.load_specialization_table(path or None)
         elif ch == "0":
             print("Goodbye ✅")
             break
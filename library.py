@@ -1,5 +1,12 @@
 import csv
+import json
 import os
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 # -------------------------
 # Data structures
@@ -10,115 +17,152 @@ books = {}
 borrowed = {}
 # set for unique names (demonstration of set usage)
 student_names = set()
+# holds: dict mapping book_id -> deque of student names waiting (FIFO)
+holds = {}
+# (book_id, student) pairs currently in a hold queue, for O(1) duplicate checks
+held = set()
 # -------------------------
 # Helper functions
 # -------------------------
 def clear_screen():
     """Clear console screen (works for Windows and Unix)."""
     os.system('cls' if os.name == 'nt' else 'clear')
-def add_book():
 
+# -------------------------
+# Core operations (no input/print, usable from scripts and batch mode)
+# -------------------------
+def add_book_record(book_id, title, author, copies):
+    """Add a new book or add copies to an existing one. Returns the book entry.
+
+    Raises ValueError for an empty book ID or a negative number of copies.
+    """
+    if not book_id:
+        raise ValueError("Book ID cannot be empty.")
+    if copies < 0:
+        raise ValueError("Invalid number of copies.")
+    info = books.get(book_id)
+    if info is not None:
+        info["copies"] += copies
+    else:
+        info = books[book_id] = {"title": title, "author": author, "copies": copies}
+    _book_changed(book_id)
+    if book_id in holds:
+        while info["copies"] > 0 and book_id in holds:
+            _serve_hold(book_id)
+    return info
+
+def borrow(student, book_id):
+    """Lend one copy of book_id to student. Returns the book entry.
+
+    Raises ValueError if the student/book is missing or no copy is available.
+    """
+    if not student:
+        raise ValueError("Student name cannot be empty.")
+    if not book_id:
+        raise ValueError("Book ID cannot be empty.")
+    info = books.get(book_id)
+    if info is None or info["copies"] <= 0:
+        if info is not None:
+            denied_requests.increment(book_id)
+        raise ValueError(f"Book {book_id} is not available.")
+    info["copies"] -= 1
+    _book_changed(book_id)
+    _record_loan(book_id, info)
+    student_names.add(student)
+    loans = borrowed.get(student)
+    if loans is None:
+        borrowed[student] = [book_id]
+    else:
+        loans.append(book_id)
+    borrowed_view.touch(student)
+    return info
+
+def return_copy(student, book_id):
+    """Take back book_id from student.
+
+    If students are waiting for the book, the copy goes straight to the
+    first of them. Returns (book entry, student who received the copy or
+    None). Raises ValueError if the student has no matching loan.
+    """
+    if not student:
+        raise ValueError("Student name cannot be empty.")
+    if not book_id:
+        raise ValueError("Book ID cannot be empty.")
+    loans = borrowed.get(student)
+    if not loans:
+        raise ValueError("No borrowing record found for this student.")
+    try:
+        loans.remove(book_id)
+    except ValueError:
+        raise ValueError(f"{student} did not borrow book {book_id}.") from None
+    borrowed_view.touch(student)
+    info = books.get(book_id)
+    if info is None:
+        # ensure book exists in books dict before incrementing copies
+        info = books[book_id] = {"title": "Unknown", "author": "Unknown", "copies": 0}
+    info["copies"] += 1
+    _book_changed(book_id)
+    _record_return(book_id)
+    next_student = _serve_hold(book_id) if book_id in holds else None
+    return info, next_student
+
+def place_hold(student, book_id):
+    """Queue student for an out-of-stock book. Returns their queue position.
+
+    Raises ValueError if the book is unknown, has copies on the shelf or the
+    student is already waiting for it.
+    """
+    if not student:
+        raise ValueError("Student name cannot be empty.")
+    if not book_id:
+        raise ValueError("Book ID cannot be empty.")
+    info = books.get(book_id)
+    if info is None:
+        raise ValueError("Book ID does not exist.")
+    if info["copies"] > 0:
+        raise ValueError(f"Book {book_id} is available; borrow it instead.")
+    if (book_id, student) in held:
+        raise ValueError(f"{student} is already waiting for {book_id}.")
+    queue = holds.get(book_id)
+    if queue is None:
+        queue = holds[book_id] = deque()
+    queue.append(student)
+    held.add((book_id, student))
+    student_names.add(student)
+    return len(queue)
+
+def _serve_hold(book_id):
+    """Lend one shelved copy of book_id to the first student waiting for it."""
+    queue = holds[book_id]
+    student = queue.popleft()
+    if not queue:
+        del holds[book_id]
+    held.discard((book_id, student))
+    borrow(student, book_id)
+    return student
+
+def add_book():
     """Add a new book (or update copies if ID exists)."""
     print("\n--- Add / Update Book ---")
     book_id = input("Enter Book ID (e.g., B101): ").strip()
     title = input("Enter Title: ").strip()
-    author = input("Enter Author: ").strip()    
+    author = input("Enter Author: ").strip()
     try:
         copies = int(input("Enter number of copies: "))
-        if copies < 0:
-            raise ValueError
     except ValueError:
         print("Invalid number of copies. Operation cancelled.")
         return
-    if book_id in books:
-        # update existing entry
-        books[book_id]['copies'] += copies
-        print(f"Updated copies for {book_id}. New copies: {books[book_id]['copies']}")
+    existed = book_id in books
+    try:
+        info = add_book_record(book_id, title, author, copies)
+    except ValueError as e:
+        print(f"{e} Operation cancelled.")
+        return
+    if existed:
+        print(f"Updated copies for {book_id}. New copies: {info['copies']}")
     else:
-        books[book_id] = {"title": title, "author": author, "copies": copies}
         print(f"Book {book_id} added successfully.")
-    def view_books():
-        """Display all books in a tabular format."""
-        print("\n--- Library Books ---")
-        if not books:
-           print("No books available.")
-           return
-        print(f"{'Book ID':<8} {'Title':<30} {'Author':<20} {'Copies':<6}")
-        print("-" * 70)
-        for bid, info in books.items():
-           print(f"{bid:<8} {info['title'][:28]:<30} {info['author'][:18]:<20} {info['copies']:<6}")
-        print("-" * 70)   
-    def search_book():
-        """Search book by ID or by title substring."""
-        print("\n--- Search Book ---")
-        print("1. Search by Book ID")
-        print("2. Search by Title keyword")
-        choice = input("Choose option (1/2): ").strip() 
-        if choice == "1":
-             bid = input("Enter Book ID: ").strip()
-             info = books.get(bid)
-             if info:
-                 print(f"Found: {bid} -> Title: {info['title']}, Author: {info['author']}, Copies: {info['copies']}")
-             else:
-               print("Book ID not found.")
-        elif choice == "2":
-               keyword = input("Enter title keyword: ").strip().lower()
-               results = [(bid, info) for bid, info in books.items() if keyword in info['title'].lower()]
-               if results:
-                   print(f"\nFound {len(results)} result(s):")
-                   for bid, info in results:
-                       print(f"{bid}: {info['title']} by {info['author']} (Copies: {info['copies']})")
-               else:
-                   print("No matching titles found.")
-        else:
-            print("Invalid option.")
-        def borrow_book():
-             """Borrow a book: check availability, reduce copies, record student."""
-             print("\n--- Borrow Book ---")
-             student = input("Enter Student Name: ").strip()
-             if not student:
-                print("Student name required.")
-             return
-             book_id = input("Enter Book ID to borrow: ").strip()
-             if book_id not in books:
-                 print("Book ID does not exist.")
-                 return
-             if books[book_id]['copies'] <= 0:
-                 print("No copies available for this book.")
-                 return
-             # proceed to borrow
-             books[book_id]['copies'] -= 1
-             student_names.add(student)
-             borrowed.setdefault(student, []).append(book_id)
-             print(f"{student} has successfully borrowed {book_id} ({books[book_id]['title']}).")
-             # Optional extra: record datetime
-             # borrowed_records.append({"student": student, "book_id": book_id, "time":datetime.now()})
-        def return_book():
-            """Return a borrowed book: validate and increment copies."""
-            print("\n--- Return Book ---")
-            student = input("Enter Student Name: ").strip()
-            if student not in borrowed or not borrowed[student]:
-                      print("No borrowing record found for this student.")
-                      return
-                      print(f"Borrowed books by {student}: {borrowed[student]}")
-                      book_id = input("Enter Book ID to return: ").strip()
-                      if book_id not in borrowed[student]:
-                            print(f"{student} did not borrow book {book_id}.")
-                            return
-                         # proceed to return
-                            borrowed[student].remove(book_id)
-                            books.setdefault(book_id, {"title": "Unknown","author": "Unknown", "copies": 0})
-                            books[book_id]['copies'] += 1
-                            print(f"{student} has returned {book_id}. Copies now: {books[book_id]['copies']}")
-                            def view_borrowed_books():
-                                """Display all borrowed books by student."""
-    print("\n--- Borrowed Books ---")
-    if not borrowed or all(len(v) == 0 for v in borrowed.values()):
-        print("No borrowed books.")
-        return
-    lines = [f"{student} -> {', '.join(book_list)}" for student, book_list in borrowed.items() if book_list]
-    for line in lines:
-        print(line)
+
 
 def save_books_to_csv(filename="books.csv"):
     """Save current books dictionary to a CSV file."""
@@ -141,6 +185,7 @@ def load_books_from_csv(filename="books.csv"):
         with open(filename, mode="r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             books.clear()
+            reset_views()
             for row in reader:
                 try:
                     copies = int(row.get("copies", 0))
@@ -159,12 +204,13 @@ def save_borrowed_to_csv(filename="borrowed.csv"):
       
     """Save borrowed dictionary to CSV."""
     try:
-        with open(filename, mode="w", newline="", encoding="utf-8") as f:writer = csv.writer(f)
-        writer.writerow(["student", "book_id"])
-        for student, book_list in borrowed.items():
-            for bid in book_list:
-                writer.writerow([student, bid])
-            print(f"Borrowed records saved to {filename}")
+        with open(filename, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["student", "book_id"])
+            for student, book_list in borrowed.items():
+                for bid in book_list:
+                    writer.writerow([student, bid])
+        print(f"Borrowed records saved to {filename}")
     except Exception as e:
         print("Error saving borrowed records:", e)
 
@@ -178,6 +224,7 @@ def load_borrowed_from_csv(filename="borrowed.csv"):
         with open(filename, mode="r", newline="", encoding="utf-8") as f:
             reader = csv.DictReader(f)
             borrowed.clear()
+            reset_views()
             for row in reader:
                 student = row.get("student", "").strip()
                 book_id = row.get("book_id", "").strip()
@@ -187,6 +234,50 @@ def load_borrowed_from_csv(filename="borrowed.csv"):
         print(f"Borrowed records loaded from {filename}")
     except Exception as e:
         print("Error loading borrowed records:", e)
+
+def save_holds_to_csv(filename="holds.csv"):
+    """Save hold queues to CSV, one row per waiting student in queue order."""
+    try:
+        with open(filename, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["book_id", "position", "student"])
+            for bid, queue in holds.items():
+                for position, student in enumerate(queue, start=1):
+                    writer.writerow([bid, position, student])
+        print(f"Hold queues saved to {filename}")
+    except Exception as e:
+        print("Error saving hold queues:", e)
+
+def load_holds_from_csv(filename="holds.csv"):
+    """Load hold queues from CSV (replaces current queues)."""
+    if not os.path.exists(filename):
+        print(f"{filename} not found.")
+        return
+    try:
+        with open(filename, mode="r", newline="", encoding="utf-8") as f:
+            rows = []
+            for row in csv.DictReader(f):
+                bid = (row.get("book_id") or "").strip()
+                student = (row.get("student") or "").strip()
+                if bid and student:
+                    try:
+                        position = int(row.get("position") or "")
+                    except ValueError:
+                        position = float("inf")
+                    rows.append((bid, position, student))
+        holds.clear()
+        held.clear()
+        # rows without a usable position go to the back of their queue;
+        # the stable sort keeps them (and equal positions) in file order
+        rows.sort(key=lambda r: (r[0], r[1]))
+        for bid, _, student in rows:
+            if (bid, student) not in held:
+                holds.setdefault(bid, deque()).append(student)
+                held.add((bid, student))
+                student_names.add(student)
+        print(f"Hold queues loaded from {filename}")
+    except Exception as e:
+        print("Error loading hold queues:", e)
 def sample_data():
  """Populate sample data (for quick testing/demo)."""
  books.clear()
@@ -198,6 +289,10 @@ def sample_data():
  "B105": {"title": "Operating Systems", "author": "Tanenbaum", "copies": 2} })
  borrowed.clear()
  student_names.clear()
+ holds.clear()
+ held.clear()
+ reset_views()
+ reset_stats()
  print("Sample data loaded.")
  
 def view_borrowed():
@@ -255,6 +350,283 @@ def search_book():
     else:
         print("Invalid choice.")
 
+# -------------------------
+# Paginated, sorted views
+# -------------------------
+class SortedView:
+    """Sorted (key, id) index over a dict, kept up to date incrementally.
+
+    Callers mark changed ids with touch(); the next page() applies just
+    those changes with bisect instead of re-sorting everything, so a page
+    costs O(page size) plus the pending updates. key(id, value) returns
+    the sort key, or None to leave the entry out of the view.
+    """
+    def __init__(self, key):
+        self.key = key
+        self.entries = []     # sorted list of (sort key, id)
+        self.keys = {}        # id -> sort key currently stored in entries
+        self.pending = set()
+        self.built = False
+
+    def touch(self, item_id):
+        if self.built:
+            self.pending.add(item_id)
+
+    def reset(self):
+        self.entries = []
+        self.keys = {}
+        self.pending = set()
+        self.built = False
+
+    def sync(self, source):
+        if not self.built or len(self.pending) > len(self.entries) // 8 + 64:
+            # first use or a large batch of changes: one full sort is cheaper
+            keys = {}
+            for item_id, value in source.items():
+                k = self.key(item_id, value)
+                if k is not None:
+                    keys[item_id] = k
+            self.keys = keys
+            self.entries = sorted((k, item_id) for item_id, k in keys.items())
+            self.pending = set()
+            self.built = True
+            return
+        entries = self.entries
+        for item_id in self.pending:
+            value = source.get(item_id)
+            new = self.key(item_id, value) if value is not None else None
+            old = self.keys.get(item_id)
+            if old == new:
+                continue
+            if old is not None:
+                del entries[bisect_left(entries, (old, item_id))]
+                del self.keys[item_id]
+            if new is not None:
+                insort(entries, (new, item_id))
+                self.keys[item_id] = new
+        self.pending = set()
+
+    def page(self, source, number=1, size=20, reverse=False):
+        """Return (ids on page `number`, total pages)."""
+        self.sync(source)
+        total = len(self.entries)
+        pages = max(1, -(-total // size))
+        start = (number - 1) * size
+        if reverse:
+            chunk = self.entries[max(total - start - size, 0):max(total - start, 0)][::-1]
+        else:
+            chunk = self.entries[start:start + size]
+        return [item_id for _, item_id in chunk], pages
+
+BOOK_SORT_KEYS = {
+    "id": lambda bid, info: bid,
+    "title": lambda bid, info: info.get("title", "").lower(),
+    "author": lambda bid, info: info.get("author", "").lower(),
+    "copies": lambda bid, info: info.get("copies", 0),
+}
+book_views = {name: SortedView(key) for name, key in BOOK_SORT_KEYS.items()}
+# students with at least one loan, sorted by name
+borrowed_view = SortedView(lambda student, loans: student.lower() if loans else None)
+
+def _book_changed(book_id):
+    for view in book_views.values():
+        view.touch(book_id)
+
+def reset_views():
+    """Drop all sorted indexes (after books/borrowed are replaced wholesale)."""
+    for view in book_views.values():
+        view.reset()
+    borrowed_view.reset()
+
+def books_page(sort_by="id", page=1, page_size=20, reverse=False):
+    """Return ([(book_id, info), ...], total pages) for one sorted page."""
+    if sort_by not in book_views:
+        raise ValueError(f"Unknown sort key: {sort_by!r} (use {', '.join(BOOK_SORT_KEYS)})")
+    ids, pages = book_views[sort_by].page(books, page, page_size, reverse)
+    return [(bid, books[bid]) for bid in ids], pages
+
+def borrowed_page(page=1, page_size=20):
+    """Return ([(student, [book_ids]), ...], total pages) sorted by student."""
+    students, pages = borrowed_view.page(borrowed, page, page_size)
+    return [(student, borrowed[student]) for student in students], pages
+
+def _page_through(show_page):
+    """Show page 1, then n/p/<number> to move and q to stop."""
+    page = 1
+    while True:
+        pages = show_page(page)
+        if pages <= 1:
+            return
+        cmd = input(f"Page {page}/{pages} - n: next, p: previous, number: jump, q: quit: ").strip().lower()
+        if cmd == "n":
+            page = min(page + 1, pages)
+        elif cmd == "p":
+            page = max(page - 1, 1)
+        elif cmd.isdigit():
+            page = min(max(int(cmd), 1), pages)
+        else:
+            return
+
+def view_books_paged():
+    """Browse books one page at a time, sorted by ID, title, author or copies."""
+    print("\n--- Library Books (paged) ---")
+    sort_by = input(f"Sort by ({'/'.join(BOOK_SORT_KEYS)}, default id): ").strip().lower() or "id"
+    if sort_by not in BOOK_SORT_KEYS:
+        print("Invalid sort key.")
+        return
+    reverse = input("Descending? (y/n): ").strip().lower() == "y"
+    if not books:
+        print("No books available.")
+        return
+
+    def show_page(page):
+        rows, pages = books_page(sort_by, page, 20, reverse)
+        print(f"{'Book ID':<8} {'Title':<30} {'Author':<20} {'Copies':<6}")
+        print("-" * 70)
+        for bid, info in rows:
+            print(f"{bid:<8} {info.get('title', '')[:28]:<30} {info.get('author', '')[:18]:<20} {info.get('copies', 0):<6}")
+        print("-" * 70)
+        return pages
+    _page_through(show_page)
+
+def view_borrowed_paged():
+    """Browse loans one page of students at a time."""
+    print("\n--- Borrowed Books (paged) ---")
+    if not borrowed or all(not v for v in borrowed.values()):
+        print("No borrowed books.")
+        return
+
+    def show_page(page):
+        rows, pages = borrowed_page(page, 20)
+        for student, book_list in rows:
+            entries = [f"{bid} ({books.get(bid, {}).get('title', 'Unknown')})" for bid in book_list]
+            print(f"{student}: {', '.join(entries)}")
+        return pages
+    _page_through(show_page)
+
+# -------------------------
+# Circulation analytics
+# -------------------------
+class TopCounter:
+    """Counter with O(1) increments and fast top-k.
+
+    Keys are also grouped into buckets by count, and the counts that have a
+    bucket are kept in a sorted list, so top(k) visits only non-empty
+    buckets instead of scanning or sorting every key.
+    """
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.counts = {}
+        self.buckets = {}     # count -> dict of keys (insertion ordered)
+        self.levels = []      # counts that have a non-empty bucket, ascending
+
+    @property
+    def max(self):
+        return self.levels[-1] if self.levels else 0
+
+    def __getitem__(self, key):
+        return self.counts.get(key, 0)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def increment(self, key):
+        count = self.counts.get(key, 0)
+        if count:
+            bucket = self.buckets[count]
+            del bucket[key]
+            if not bucket:
+                del self.buckets[count]
+                del self.levels[bisect_left(self.levels, count)]
+        count += 1
+        self.counts[key] = count
+        bucket = self.buckets.get(count)
+        if bucket is None:
+            self.buckets[count] = {key: None}
+            insort(self.levels, count)
+        else:
+            bucket[key] = None
+        return count
+
+    def top(self, k=10):
+        """Return up to k (key, count) pairs, highest count first."""
+        result = []
+        for count in reversed(self.levels):
+            for key in self.buckets[count]:
+                result.append((key, count))
+                if len(result) == k:
+                    return result
+        return result
+
+# all counters are updated inside borrow()/return_copy()
+borrow_counts = TopCounter()    # book_id -> successful loans
+author_borrows = TopCounter()   # author -> successful loans
+stockouts = TopCounter()        # book_id -> times a loan took the last copy
+denied_requests = TopCounter()  # book_id -> borrow attempts with no copy left
+loan_peaks = TopCounter()       # book_id -> highest number of concurrent loans
+active_loans = {}               # book_id -> loans currently out (since stats reset)
+
+def reset_stats():
+    """Forget all circulation counters."""
+    for counter in (borrow_counts, author_borrows, stockouts, denied_requests, loan_peaks):
+        counter.clear()
+    active_loans.clear()
+
+def _record_loan(book_id, info):
+    borrow_counts.increment(book_id)
+    author_borrows.increment(info.get("author", "Unknown"))
+    out = active_loans.get(book_id, 0) + 1
+    active_loans[book_id] = out
+    if out > loan_peaks[book_id]:
+        loan_peaks.increment(book_id)
+    if info["copies"] == 0:
+        stockouts.increment(book_id)
+
+def _record_return(book_id):
+    out = active_loans.get(book_id)
+    if out:
+        active_loans[book_id] = out - 1
+
+def out_of_stock(limit=10):
+    """Books currently at zero copies, most-requested first.
+
+    Uses the incrementally maintained copies index, so only the zero-copy
+    prefix is read.
+    """
+    view = book_views["copies"]
+    view.sync(books)
+    end = bisect_left(view.entries, (1,))
+    ids = [bid for _, bid in view.entries[:end]]
+    ids.sort(key=lambda bid: denied_requests[bid], reverse=True)
+    return [(bid, denied_requests[bid], stockouts[bid]) for bid in ids[:limit]]
+
+def show_analytics(k=5):
+    """Print demand and availability reports."""
+    print("\n--- Holdings Analytics ---")
+    sections = [
+        ("Most borrowed books", borrow_counts),
+        ("Most borrowed authors", author_borrows),
+        ("Waitlist pressure (denied requests)", denied_requests),
+        ("Most frequent stock-outs", stockouts),
+        ("Peak concurrent loans", loan_peaks),
+    ]
+    for heading, counter in sections:
+        print(f"\n{heading}:")
+        rows = counter.top(k)
+        if not rows:
+            print("  (no data yet)")
+        for key, count in rows:
+            title = books.get(key, {}).get("title", "") if counter is not author_borrows else ""
+            print(f"  {key:<10} {title[:28]:<30} {count}")
+    print("\nCurrently at zero copies:")
+    rows = out_of_stock(k)
+    if not rows:
+        print("  (none)")
+    for bid, denied, outs in rows:
+        print(f"  {bid:<10} {books[bid].get('title', '')[:28]:<30} denied {denied}, stock-outs {outs}")
+
 def borrow_book():
     """Borrow a book: validate availability and record borrowing."""
     print("\n--- Borrow Book ---")
@@ -262,19 +634,19 @@ def borrow_book():
     if not student:
         print("Student name cannot be empty.")
         return
-    student_names.add(student)
-    if student not in borrowed:
-        borrowed[student] = []
     book_id = input("Enter Book ID: ").strip()
-    if not book_id:
-        print("Book ID cannot be empty.")
-        return
-    info = books.get(book_id)
-    if not info or info.get("copies", 0) <= 0:
-        print(f"Book {book_id} is not available.")
+    try:
+        info = borrow(student, book_id)
+    except ValueError as e:
+        print(e)
+        if book_id in books and input("Join the waiting list for this book? (y/n): ").strip().lower() == "y":
+            try:
+                position = place_hold(student, book_id)
+            except ValueError as e:
+                print(e)
+                return
+            print(f"{student} is number {position} in the queue for {book_id}.")
         return
-    borrowed[student].append(book_id)
-    books[book_id]["copies"] = info.get("copies", 0) - 1
     print(f"{student} has successfully borrowed {book_id} ({info.get('title','Unknown')}).")
     
 def return_book():
@@ -289,21 +661,343 @@ def return_book():
         return
     print(f"Borrowed books by {student}: {borrowed[student]}")
     book_id = input("Enter Book ID to return: ").strip()
-    if not book_id:
-        print("Book ID cannot be empty.")
-        return
-    if book_id not in borrowed[student]:
-        print(f"{student} did not borrow book {book_id}.")
+    try:
+        info, next_student = return_copy(student, book_id)
+    except ValueError as e:
+        print(e)
         return
-    # proceed to return
-    borrowed[student].remove(book_id)
-    # ensure book exists in books dict and increment copies
-    books.setdefault(book_id, {"title": "Unknown", "author": "Unknown", "copies": 0})
-    books[book_id]["copies"] = books[book_id].get("copies", 0) + 1
-    print(f"{student} has returned {book_id}. Copies now: {books[book_id]['copies']}")
+    print(f"{student} has returned {book_id}. Copies now: {info['copies']}")
+    if next_student:
+        print(f"Copy handed to {next_student}, who was waiting for it.")
+
+# -------------------------
+# Batch transactions
+# -------------------------
+# A transaction is a dict with an "op" key ("add", "borrow", "return" or "hold") plus
+# the fields that op needs. CSV logs use the header
+#   op,book_id,title,author,copies,student
+# and JSONL logs hold one such object per line.
+TRANSACTION_FIELDS = ["op", "book_id", "title", "author", "copies", "student"]
+TRANSACTION_OPS = ("add", "borrow", "return", "hold")
+
+def read_transactions(filename):
+    """Yield (line_no, transaction dict) from a .csv or .jsonl circulation log."""
+    with open(filename, mode="r", newline="", encoding="utf-8") as f:
+        if filename.lower().endswith((".jsonl", ".ndjson")):
+            for line_no, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    tx = json.loads(line)
+                except json.JSONDecodeError as e:
+                    tx = {"op": None, "_error": f"Invalid JSON: {e.msg}"}
+                yield line_no, tx
+        else:
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            # line 1 is the header row; zip() is much cheaper than DictReader
+            for line_no, row in enumerate(reader, start=2):
+                if row:
+                    yield line_no, dict(zip(header, row))
+
+def validate_transactions(transactions):
+    """Check every transaction's shape up front (ops, fields, copies).
+
+    Returns (valid, failures) where valid is a list of (line_no, op, args)
+    ready for apply_transactions and failures is a list of
+    {"line", "op", "error"} dicts. Stock and loan checks happen when applying.
+    """
+    valid = []
+    failures = []
+    append = valid.append
+    for line_no, tx in transactions:
+        if not isinstance(tx, dict):
+            failures.append({"line": line_no, "op": None, "error": "Transaction must be an object."})
+            continue
+        if "_error" in tx:
+            failures.append({"line": line_no, "op": tx.get("op"), "error": tx["_error"]})
+            continue
+        op = tx.get("op")
+        if op not in TRANSACTION_OPS:
+            op = str(op or "").strip().lower()
+            if op not in TRANSACTION_OPS:
+                failures.append({"line": line_no, "op": op or None, "error": f"Unknown operation: {op!r}"})
+                continue
+        book_id = str(tx.get("book_id") or "").strip()
+        if op == "add":
+            if not book_id:
+                failures.append({"line": line_no, "op": op, "error": "Missing field(s): book_id"})
+                continue
+            try:
+                copies = int(tx.get("copies"))
+                if copies < 0:
+                    raise ValueError
+            except (TypeError, ValueError):
+                failures.append({"line": line_no, "op": op, "error": "Invalid number of copies."})
+                continue
+            append((line_no, op, (book_id, str(tx.get("title") or "").strip(),
+                                  str(tx.get("author") or "").strip(), copies)))
+        else:
+            student = str(tx.get("student") or "").strip()
+            if not student or not book_id:
+                missing = [name for name, value in (("student", student), ("book_id", book_id)) if not value]
+                failures.append({"line": line_no, "op": op, "error": f"Missing field(s): {', '.join(missing)}"})
+                continue
+            append((line_no, op, (student, book_id)))
+    return valid, failures
+
+def apply_transactions(valid):
+    """Apply validated transactions in order. Returns (applied, failures)."""
+    handlers = {"add": add_book_record, "borrow": borrow, "return": return_copy, "hold": place_hold}
+    applied = 0
+    failures = []
+    for line_no, op, args in valid:
+        try:
+            handlers[op](*args)
+        except ValueError as e:
+            failures.append({"line": line_no, "op": op, "error": str(e)})
+        else:
+            applied += 1
+    return applied, failures
+
+def run_batch(filename, failures_file=None):
+    """Replay a circulation log against the current books/borrowed state.
+
+    Prints a summary, optionally writes per-transaction failures to a CSV
+    and returns a dict with the counts and the failure list.
+    """
+    if not os.path.exists(filename):
+        print(f"{filename} not found.")
+        return None
+    start = time.perf_counter()
+    valid, failures = validate_transactions(read_transactions(filename))
+    applied, apply_failures = apply_transactions(valid)
+    failures.extend(apply_failures)
+    failures.sort(key=lambda item: item["line"])
+    elapsed = time.perf_counter() - start
+    total = applied + len(failures)
+    rate = total / elapsed if elapsed > 0 else float("inf")
+    print(f"Batch {filename}: {applied} applied, {len(failures)} failed "
+          f"({total} transactions in {elapsed:.3f}s, {rate:,.0f} tx/s)")
+    for item in failures[:10]:
+        print(f"  line {item['line']} [{item['op']}]: {item['error']}")
+    if len(failures) > 10:
+        print(f"  ... {len(failures) - 10} more")
+    if failures_file and failures:
+        try:
+            with open(failures_file, mode="w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=["line", "op", "error"])
+                writer.writeheader()
+                writer.writerows(failures)
+            print(f"Failures written to {failures_file}")
+        except Exception as e:
+            print("Error saving failures:", e)
+    return {"applied": applied, "failed": len(failures), "seconds": elapsed, "failures": failures}
+
+def run_batch_menu():
+    """Prompt for a transaction log and replay it."""
+    print("\n--- Batch Transactions ---")
+    filename = input("Enter transaction file (.csv or .jsonl): ").strip()
+    failures_file = input("Save failures to (blank to skip): ").strip()
+    run_batch(filename, failures_file or None)
+
+# -------------------------
+# Bulk catalog import
+# -------------------------
+class Catalog:
+    """Compact column store for very large catalogs.
+
+    Each book gets an integer handle; titles and authors live in parallel
+    lists (authors are interned so repeated names share one string) and
+    copies in an array of machine ints instead of one dict per book.
+    """
+    def __init__(self):
+        self.index = {}            # book_id -> handle
+        self.ids = []
+        self.titles = []
+        self.authors = []
+        self.copies = array("l")
+
+    def __len__(self):
+        return len(self.ids)
 
+    def __contains__(self, book_id):
+        return book_id in self.index
+
+    def add(self, book_id, title, author, copies):
+        """Insert a book (a repeated ID overwrites, like load_books_from_csv)."""
+        author = sys.intern(author)
+        handle = self.index.get(book_id)
+        if handle is None:
+            self.index[book_id] = len(self.ids)
+            self.ids.append(book_id)
+            self.titles.append(title)
+            self.authors.append(author)
+            self.copies.append(copies)
+        else:
+            self.titles[handle] = title
+            self.authors[handle] = author
+            self.copies[handle] = copies
+        return handle
 
+    def extend(self, ids, titles, authors, copies):
+        """Append parsed columns, falling back to add() when IDs repeat."""
+        base = len(self.ids)
+        new_index = dict(zip(ids, range(base, base + len(ids))))
+        if len(new_index) != len(ids) or not self.index.keys().isdisjoint(new_index):
+            for row in zip(ids, titles, authors, copies):
+                self.add(*row)
+            return
+        intern = sys.intern
+        self.index.update(new_index)
+        self.ids.extend(ids)
+        self.titles.extend(titles)
+        self.authors.extend(map(intern, authors))
+        self.copies.extend(copies)
+
+    def get(self, book_id):
+        """Return the book as a books-style dict, or None."""
+        handle = self.index.get(book_id)
+        if handle is None:
+            return None
+        return {"title": self.titles[handle], "author": self.authors[handle], "copies": self.copies[handle]}
+
+    def to_books(self):
+        """Expand into the books dict layout used by the rest of the module."""
+        return {bid: {"title": t, "author": a, "copies": c}
+                for bid, t, a, c in zip(self.ids, self.titles, self.authors, self.copies)}
+
+def _chunk_offsets(filename, chunk_bytes):
+    """Split the file after its header into line-aligned (start, end) byte ranges."""
+    size = os.path.getsize(filename)
+    ranges = []
+    with open(filename, "rb") as f:
+        f.readline()  # header
+        start = f.tell()
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            if f.tell() < size:
+                f.readline()
+            end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def _parse_catalog_chunk(job):
+    """Worker: parse one byte range of books.csv into columns plus rejects.
+
+    Returns (ids, titles, authors, copies, rejects, line_count) where rejects
+    holds (local_line_index, reason, raw_fields) tuples.
+    """
+    filename, start, end, columns = job
+    with open(filename, "rb") as f:
+        f.seek(start)
+        # split the bytes on b"\n" only: str.splitlines() would also break
+        # rows at U+2028, form feeds and other characters valid in a title
+        lines = f.read(end - start).split(b"\n")
+    if lines and not lines[-1]:
+        lines.pop()
+    lines = [line.decode("utf-8") for line in lines]
+    i_id, i_title, i_author, i_copies = columns
+    width = max(columns) + 1
+    ids, titles, authors, copies, rejects = [], [], [], array("l"), []
+    intern = sys.intern
+    for n, row in enumerate(csv.reader(lines)):
+        if not row:
+            continue  # blank line, skipped like DictReader does (n still counts it)
+        if len(row) < width:
+            rejects.append((n, "wrong number of fields", row))
+            continue
+        book_id = row[i_id].strip()
+        if not book_id:
+            rejects.append((n, "empty book_id", row))
+            continue
+        try:
+            count = int(row[i_copies])
+        except ValueError:
+            rejects.append((n, "copies is not an integer", row))
+            continue
+        if count < 0:
+            rejects.append((n, "negative copies", row))
+            continue
+        ids.append(book_id)
+        titles.append(row[i_title])
+        authors.append(intern(row[i_author]))
+        copies.append(count)
+    return ids, titles, authors, copies, rejects, len(lines)
+
+def bulk_load_books(filename="books.csv", rejects_file="books_rejects.csv", workers=None,
+                    chunk_bytes=8 * 1024 * 1024):
+    """Parse a large books.csv in parallel chunks into a Catalog.
+
+    Rows with missing fields, an empty ID or bad copies are written to
+    rejects_file (with their line numbers) instead of being loaded. Records
+    must be one per line, which is what save_books_to_csv produces.
+    Returns the Catalog, or None if the file is missing or unreadable.
+    """
+    if not os.path.exists(filename):
+        print(f"{filename} not found.")
+        return None
+    start_time = time.perf_counter()
+    with open(filename, mode="r", newline="", encoding="utf-8") as f:
+        header = [name.strip() for name in next(csv.reader(f), [])]
+    try:
+        columns = tuple(header.index(name) for name in ("book_id", "title", "author", "copies"))
+    except ValueError:
+        print("Error loading books: header must contain book_id, title, author, copies")
+        return None
+    jobs = [(filename, start, end, columns) for start, end in _chunk_offsets(filename, chunk_bytes)]
+    catalog = Catalog()
+    rejected = []
+    line_no = 2  # first data line
+    try:
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if len(jobs) <= 1 or workers <= 1:
+            results = map(_parse_catalog_chunk, jobs)
+            pool = None
+        else:
+            pool = ProcessPoolExecutor(max_workers=workers)
+            results = pool.map(_parse_catalog_chunk, jobs)
+        try:
+            # results arrive in file order, so line numbers can be rebased
+            for ids, titles, authors, copies, rejects, line_count in results:
+                catalog.extend(ids, titles, authors, copies)
+                rejected.extend((line_no + n, reason, raw) for n, reason, raw in rejects)
+                line_no += line_count
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    except Exception as e:
+        print("Error loading books:", e)
+        return None
+    elapsed = time.perf_counter() - start_time
+    rows = len(catalog) + len(rejected)
+    rate = rows / elapsed if elapsed > 0 else float("inf")
+    print(f"Bulk loaded {len(catalog)} books from {filename} "
+          f"({rows} rows in {elapsed:.3f}s, {rate:,.0f} rows/s, {len(rejected)} rejected)")
+    if rejected and rejects_file:
+        try:
+            with open(rejects_file, mode="w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(["line", "reason"] + header)
+                for line, reason, raw in rejected:
+                    writer.writerow([line, reason] + raw)
+            print(f"Rejected rows written to {rejects_file}")
+        except Exception as e:
+            print("Error saving rejected rows:", e)
+    return catalog
 
+def bulk_load_menu():
+    """Bulk import a catalog CSV and make it the current books."""
+    print("\n--- Bulk Catalog Import ---")
+    filename = input("Enter catalog CSV (default: books.csv): ").strip() or "books.csv"
+    catalog = bulk_load_books(filename)
+    if catalog is not None:
+        books.clear()
+        books.update(catalog.to_books())
+        reset_views()
 
 def show_menu():
     """Display main menu options."""
@@ -316,9 +1010,14 @@ def show_menu():
     print("4. Borrow Book")
     print("5. Return Book")
     print("6. View Borrowed Records")
-    print("7. Save books & borrowed records to CSV")
-    print("8. Load books & borrowed records from CSV")
+    print("7. Save books, borrowed records & holds to CSV")
+    print("8. Load books, borrowed records & holds from CSV")
     print("9. Load Sample Data (demo)")
+    print("10. Apply batch transactions (CSV/JSONL)")
+    print("11. Bulk import large catalog CSV")
+    print("12. Browse books (sorted, paged)")
+    print("13. Browse borrowed records (paged)")
+    print("14. Holdings analytics (demand & availability)")
     print("0. Exit")
     # ...existing code...
 def main_loop():
@@ -340,11 +1039,23 @@ def main_loop():
         elif choice == "7":
             save_books_to_csv()
             save_borrowed_to_csv()
+            save_holds_to_csv()
         elif choice == "8":
             load_books_from_csv()
             load_borrowed_from_csv()
+            load_holds_from_csv()
         elif choice == "9":
             sample_data()
+        elif choice == "10":
+            run_batch_menu()
+        elif choice == "11":
+            bulk_load_menu()
+        elif choice == "12":
+            view_books_paged()
+        elif choice == "13":
+            view_borrowed_paged()
+        elif choice == "14":
+            show_analytics()
         elif choice == "0":
             print("Exiting... Goodbye!")
             break
@@ -1,51 +1,264 @@
+from __future__ import annotations
+
 import os
 import sys
+import csv
 import json
+import hashlib
+import importlib
+import functools
 from pathlib import Path
 import logging
+import time
 from typing import List, Dict, Tuple
 
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
+# --------------------
+# Lazy heavy imports
+# --------------------
+# numpy/pandas are imported on first use and matplotlib only inside
+# create_dashboard, so importing this module stays cheap for batch workers.
+class _LazyModule:
+    """Stand-in that imports the real module on first attribute access."""
+    def __init__(self, name: str, alias: str):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module  # later lookups skip the proxy
+        return getattr(module, attr)
+
+np = _LazyModule("numpy", "np")
+pd = _LazyModule("pandas", "pd")
 
 # --------------------
 # Setup logging
 # --------------------
-logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+# Only the CLI configures handlers; importing the module leaves logging alone.
+logger = logging.getLogger(__name__)
+LOG_FORMAT = "%(asctime)s - %(levelname)s - %(message)s"
 
 # --------------------
 # Constants / Paths
 # --------------------
-ROOT = Path.cwd()
-DATA_DIR = ROOT / "data"
-OUTPUT_DIR = ROOT / "output"
-DATA_DIR.mkdir(exist_ok=True)
-OUTPUT_DIR.mkdir(exist_ok=True)
-
-SAMPLE_CSV = DATA_DIR / "sample_student_scores.csv"
-CLEANED_CSV = OUTPUT_DIR / "cleaned_student_data.csv"
-SUMMARY_CSV = OUTPUT_DIR / "student_summary.csv"
-DASHBOARD_PNG = OUTPUT_DIR / "student_performance_dashboard.png"
-SUMMARY_TXT = OUTPUT_DIR / "performance_summary.txt"
+def configure_paths(root: Path = None, data_dir: Path = None, output_dir: Path = None):
+    """Set where data, cache and outputs live. Nothing is created on disk here.
+
+    Defaults come from STUDENT_ANALYZER_ROOT / _DATA_DIR / _OUTPUT_DIR, then
+    the current directory. Folders are made when something is written.
+    """
+    global ROOT, DATA_DIR, OUTPUT_DIR, SAMPLE_CSV, CLEANED_CSV, SUMMARY_CSV
+    global DASHBOARD_PNG, SUMMARY_TXT, CACHE_DIR
+    ROOT = Path(root or os.environ.get("STUDENT_ANALYZER_ROOT") or Path.cwd())
+    DATA_DIR = Path(data_dir or os.environ.get("STUDENT_ANALYZER_DATA_DIR") or ROOT / "data")
+    OUTPUT_DIR = Path(output_dir or os.environ.get("STUDENT_ANALYZER_OUTPUT_DIR") or ROOT / "output")
+    SAMPLE_CSV = DATA_DIR / "sample_student_scores.csv"
+    CLEANED_CSV = OUTPUT_DIR / "cleaned_student_data.csv"
+    SUMMARY_CSV = OUTPUT_DIR / "student_summary.csv"
+    DASHBOARD_PNG = OUTPUT_DIR / "student_performance_dashboard.png"
+    SUMMARY_TXT = OUTPUT_DIR / "performance_summary.txt"
+    CACHE_DIR = DATA_DIR / ".cache"
+
+configure_paths()
+
+# --------------------
+# Stage profiling
+# --------------------
+# Off by default. run_cli(profile=True), `--profile` or STUDENT_ANALYZER_PROFILE=1
+# turn it on; STUDENT_ANALYZER_CPROFILE=1 (or a file path) adds a cProfile dump.
+PROFILER = None
+
+class StageProfiler:
+    """Record wall time, CPU time, peak traced memory and rows per pipeline stage.
+
+    Stages may nest (export_outputs calls student_summary_df); each stage's
+    peak includes its children. CPU time is this process only, so work done
+    in process pools is not counted. tracemalloc makes the profiled run
+    noticeably slower, so compare reports with each other, not with
+    unprofiled timings.
+    """
+    def __init__(self, report_path: Path = None, cprofile_path: Path = None):
+        import tracemalloc
+        self.report_path = Path(report_path or OUTPUT_DIR / "profile_report.json")
+        self.cprofile_path = Path(cprofile_path) if cprofile_path else None
+        self.records: List[dict] = []
+        self._stack: List[dict] = []
+        self._cprofile = None
+        if self.cprofile_path is not None:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+        self._tracemalloc = tracemalloc
+        # only stop tracing in close() if it was this profiler that started it
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start()
+
+    def close(self):
+        """Stop tracemalloc (if this profiler started it) and any open cProfile run."""
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self.started_tracing and self._tracemalloc.is_tracing():
+            self._tracemalloc.stop()
+        self.started_tracing = False
+
+    def _fold_peak(self):
+        # reset_peak() lets nested stages measure their own peak; open
+        # stages keep the running maximum so theirs still covers children.
+        _, peak = self._tracemalloc.get_traced_memory()
+        for frame in self._stack:
+            frame["peak"] = max(frame["peak"], peak)
+        self._tracemalloc.reset_peak()
+
+    def stage(self, name: str):
+        return _Stage(self, name)
+
+    def _enter(self, name: str) -> dict:
+        self._fold_peak()
+        current, _ = self._tracemalloc.get_traced_memory()
+        if not self._stack and self._cprofile is not None:
+            self._cprofile.enable()
+        frame = {"stage": name, "depth": len(self._stack), "rows": None,
+                 "start_mem": current, "peak": current,
+                 "wall": time.perf_counter(), "cpu": time.process_time()}
+        self._stack.append(frame)
+        return frame
+
+    def _exit(self, frame: dict, error: BaseException = None):
+        wall = time.perf_counter() - frame["wall"]
+        cpu = time.process_time() - frame["cpu"]
+        self._fold_peak()
+        self._stack.pop()
+        if not self._stack and self._cprofile is not None:
+            self._cprofile.disable()
+        self.records.append({
+            "stage": frame["stage"], "depth": frame["depth"], "rows": frame["rows"],
+            "wall_s": round(wall, 6), "cpu_s": round(cpu, 6),
+            "peak_bytes": frame["peak"] - frame["start_mem"],
+            "error": repr(error) if error is not None else None,
+        })
+
+    def totals(self) -> Dict[str, dict]:
+        out: Dict[str, dict] = {}
+        for r in self.records:
+            t = out.setdefault(r["stage"], {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0,
+                                            "max_peak_bytes": 0, "rows": None})
+            t["calls"] += 1
+            t["wall_s"] = round(t["wall_s"] + r["wall_s"], 6)
+            t["cpu_s"] = round(t["cpu_s"] + r["cpu_s"], 6)
+            t["max_peak_bytes"] = max(t["max_peak_bytes"], r["peak_bytes"])
+            if r["rows"] is not None:
+                t["rows"] = r["rows"]
+        return out
+
+    def write_report(self) -> Path:
+        """Write the JSON report (and the cProfile dump, if enabled)."""
+        import platform
+        report = {
+            "generated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "stages": self.records,
+            "totals": self.totals(),
+        }
+        self.report_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.report_path, "w") as f:
+            json.dump(report, f, indent=2)
+        if self._cprofile is not None:
+            self._cprofile.dump_stats(str(self.cprofile_path))
+        logger.info(f"Profile report written to {self.report_path}")
+        return self.report_path
+
+class _Stage:
+    def __init__(self, profiler: StageProfiler, name: str):
+        self.profiler = profiler
+        self.name = name
+        self.frame = None
+
+    def __enter__(self) -> dict:
+        self.frame = self.profiler._enter(self.name)
+        return self.frame
+
+    def __exit__(self, exc_type, exc, tb):
+        self.profiler._exit(self.frame, exc)
+        return False
+
+def enable_profiling(report_path: Path = None, cprofile_path: Path = None) -> StageProfiler:
+    """Start recording stages; returns the profiler (also kept in PROFILER)."""
+    global PROFILER
+    disable_profiling()
+    PROFILER = StageProfiler(report_path, cprofile_path)
+    return PROFILER
+
+def disable_profiling():
+    """Stop recording stages and the memory tracing that enable_profiling() started."""
+    global PROFILER
+    if PROFILER is not None:
+        PROFILER.close()
+    PROFILER = None
+
+def profiling_from_env() -> StageProfiler:
+    """Enable profiling if STUDENT_ANALYZER_PROFILE is set (1 or a report path)."""
+    flag = os.environ.get("STUDENT_ANALYZER_PROFILE", "").strip()
+    if flag.lower() in ("", "0", "false", "no"):
+        return None
+    dump = os.environ.get("STUDENT_ANALYZER_CPROFILE", "").strip()
+    report = None if flag.lower() in ("1", "true", "yes") else Path(flag)
+    if dump.lower() in ("", "0", "false", "no"):
+        dump = None
+    elif dump.lower() in ("1", "true", "yes"):
+        dump = OUTPUT_DIR / "profile.pstats"
+    return enable_profiling(report, dump)
+
+def profiled(stage: str, rows=None):
+    """Decorator: time the call as `stage` when profiling is on.
+
+    rows(result, *args) gives the row count to record for the stage.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if PROFILER is None:
+                return fn(*args, **kwargs)
+            with PROFILER.stage(stage) as frame:
+                result = fn(*args, **kwargs)
+                if rows is not None:
+                    frame["rows"] = int(rows(result, *args))
+            return result
+        return wrapper
+    return decorate
+
+def _loaded_rows(result, manager, *args) -> int:
+    if manager.aggregates is not None:
+        return manager.aggregates.rows
+    return len(manager.df)
+
+def _summary_rows(result, manager, *args) -> int:
+    return len(manager.summary)
+
+def _result_rows(result, *args) -> int:
+    return 0 if result is None else len(result)
 
 # --------------------
 # Utility functions
 # --------------------
-def safe_read_csv(path: Path) -> pd.DataFrame:
-    """Read CSV with basic exception handling and return DataFrame."""
+def safe_read_csv(path: Path, **kwargs) -> pd.DataFrame:
+    """Read CSV with basic exception handling and return DataFrame.
+
+    Extra keyword arguments go to pd.read_csv (e.g. chunksize=..., which
+    returns an iterator of DataFrames instead).
+    """
     try:
-        df = pd.read_csv(path)
-        logging.info(f"Loaded data from {path}")
+        df = pd.read_csv(path, **kwargs)
+        logger.info(f"Loaded data from {path}")
         return df
     except FileNotFoundError:
-        logging.error(f"File not found: {path}")
+        logger.error(f"File not found: {path}")
         raise
     except pd.errors.EmptyDataError:
-        logging.error(f"No data: {path}")
+        logger.error(f"No data: {path}")
         raise
     except Exception as e:
-        logging.error(f"Error reading {path}: {e}")
+        logger.error(f"Error reading {path}: {e}")
         raise
 
 def ensure_sample_data():
@@ -66,36 +279,381 @@ def ensure_sample_data():
         {"Name":"Priya Singh","Roll_No":"23BCA004","Gender":"F","Subject":"Physics","Marks":94,"Attendance":98,"Semester":1},
         {"Name":"Priya Singh","Roll_No":"23BCA004","Gender":"F","Subject":"Chemistry","Marks":97,"Attendance":98,"Semester":1},
     ])
+    SAMPLE_CSV.parent.mkdir(parents=True, exist_ok=True)
     sample.to_csv(SAMPLE_CSV, index=False)
-    logging.info(f"Sample dataset created at {SAMPLE_CSV}")
+    logger.info(f"Sample dataset created at {SAMPLE_CSV}")
+
+GRADE_BANDS = [(90, "A+"), (80, "A"), (70, "B"), (60, "C"), (50, "D")]
+
+def grade_array(averages) -> np.ndarray:
+    """Vectorized Student.grade(): map an array of averages to grade labels."""
+    averages = np.asarray(averages, dtype=float)
+    return np.select([averages >= cutoff for cutoff, _ in GRADE_BANDS],
+                     [label for _, label in GRADE_BANDS], default="F")
+
+def summarize_marks(df: pd.DataFrame, gender: pd.Series = None) -> pd.DataFrame:
+    """Build the student summary table from cleaned mark rows with column operations.
+
+    Same result as building Student objects and calling to_dict() on each:
+    one row per (Roll_No, Name), a Mark_<Subject> column per subject (a
+    repeated subject keeps its last mark, like Student.add_mark), then
+    Total, Average (rounded to 2) and Grade. `gender` optionally supplies
+    each (Roll_No, Name)'s gender instead of taking it from df's first row.
+    """
+    if df.empty:
+        return pd.DataFrame()
+    keys = ["Roll_No", "Name"]
+    marks = df.drop_duplicates(keys + ["Subject"], keep="last")
+    wide = marks.pivot(index=keys, columns="Subject", values="Marks").astype(float)
+    wide.columns = [f"Mark_{sub}" for sub in wide.columns]
+    total = wide.sum(axis=1)
+    average = total / wide.count(axis=1)
+    summary = wide.reset_index()
+    if gender is None and "Gender" in df.columns:
+        gender = df.drop_duplicates(keys, keep="first").set_index(keys)["Gender"]
+    if gender is not None and not gender.empty:
+        summary.insert(2, "Gender", gender.reindex(wide.index).to_numpy())
+    else:
+        summary.insert(2, "Gender", None)
+    summary["Total"] = total.to_numpy()
+    summary["Average"] = average.round(2).to_numpy()
+    summary["Grade"] = grade_array(average.to_numpy())
+    return summary
+
+# --------------------
+# Columnar cache
+# --------------------
+CACHE_VERSION = 2  # 2: only the mark columns are narrowed; IDs keep their dtype
+# column -> compact dtype, applied only when the conversion is lossless
+NARROW_DTYPES = {"Marks": "float32", "Attendance": "uint8", "Semester": "uint8"}
+
+def _narrowed(values: pd.Series, dtype: str) -> pd.Series:
+    if not pd.api.types.is_numeric_dtype(values) or pd.api.types.is_bool_dtype(values):
+        return values
+    arr = values.to_numpy(dtype="float64")
+    finite = np.isfinite(arr)
+    if dtype == "uint8":
+        if finite.all() and (arr >= 0).all() and (arr <= 255).all() and (arr == np.round(arr)).all():
+            return values.astype("uint8")
+    elif (arr.astype("float32").astype("float64")[finite] == arr[finite]).all():
+        return values.astype("float32")
+    return values
+
+def compact_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Return df with text columns as categoricals and the mark columns narrowed.
+
+    Marks becomes float32 and Attendance/Semester uint8 when that is
+    lossless; other numeric columns (e.g. numeric Roll_No) are left as is.
+    """
+    out = {}
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            out[col] = values
+        elif pd.api.types.is_numeric_dtype(values):
+            out[col] = _narrowed(values, NARROW_DTYPES[col]) if col in NARROW_DTYPES else values
+        else:
+            out[col] = values.astype(str).where(values.notna()).astype("category")
+    return pd.DataFrame(out).reset_index(drop=True)
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def cache_path_for(source: Path) -> Path:
+    """Cache file for a source CSV (one per absolute source path)."""
+    source = Path(source).resolve()
+    tag = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:12]
+    return CACHE_DIR / f"{source.stem}.{tag}.npz"
+
+def frame_arrays(df: pd.DataFrame, meta: dict) -> Dict[str, np.ndarray]:
+    """Columns of df as .npz arrays (categorical codes + categories, numeric arrays)."""
+    meta = dict(meta, columns=[str(c) for c in df.columns])
+    arrays = {"__meta__": np.array(json.dumps(meta))}
+    for i, col in enumerate(df.columns):
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            arrays[f"c{i}_codes"] = values.cat.codes.to_numpy()
+            arrays[f"c{i}_cats"] = np.asarray(values.cat.categories.astype(str), dtype=str)
+        elif values.dtype == object or isinstance(values.dtype, pd.StringDtype):
+            arrays[f"c{i}"] = np.asarray(values.astype(str), dtype=str)
+        else:
+            arrays[f"c{i}"] = values.to_numpy()
+    return arrays
+
+def save_frame_cache(df: pd.DataFrame, source: Path, digest: str = None):
+    """Store a cleaned frame as a .npz (categorical codes + categories, numeric arrays)."""
+    source = Path(source)
+    stat = source.stat()
+    meta = {"version": CACHE_VERSION, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+            "sha256": digest or _file_digest(source)}
+    arrays = frame_arrays(df, meta)
+    path = cache_path_for(source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp, path)
+    logger.info(f"Cached cleaned data at {path}")
+
+def load_frame_cache(source: Path):
+    """Return the cached cleaned frame for source, or None if missing or stale.
+
+    A cache entry is valid when the source's size and mtime match, or when
+    they changed but the content hash is still the same.
+    """
+    path = cache_path_for(source)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["__meta__"]))
+            if meta.get("version") != CACHE_VERSION:
+                return None
+            stat = Path(source).stat()
+            if (meta["size"], meta["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                if meta["size"] != stat.st_size or meta["sha256"] != _file_digest(Path(source)):
+                    return None
+            columns = {}
+            for i, col in enumerate(meta["columns"]):
+                if f"c{i}_codes" in data:
+                    columns[col] = pd.Categorical.from_codes(data[f"c{i}_codes"], data[f"c{i}_cats"])
+                else:
+                    columns[col] = data[f"c{i}"]
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable cache {path}: {e}")
+        return None
+    logger.info(f"Loaded cleaned data from cache {path}")
+    return pd.DataFrame(columns)
+
+# --------------------
+# Chunked aggregation
+# --------------------
+STUDENT_KEYS = ["Roll_No", "Name"]
+SUBJECT_STAT_COLS = ["count", "mean", "m2", "min", "max"]
+
+def concat_frames(frames: List[pd.DataFrame]) -> pd.DataFrame:
+    """pd.concat that keeps categorical columns categorical.
+
+    Plain concat turns categoricals with different categories into object
+    columns; here the categories are unioned first so codes stay compact.
+    """
+    frames = [f for f in frames if not f.empty]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+    columns = list(dict.fromkeys(col for f in frames for col in f.columns))
+    for col in columns:
+        present = [f[col] for f in frames if col in f.columns]
+        if not any(isinstance(v.dtype, pd.CategoricalDtype) for v in present):
+            continue
+        # a column can be numeric in one file and text in another (e.g. roll
+        # numbers 1001 vs 23BCA001); compare everything as strings then
+        as_text = [v if isinstance(v.dtype, pd.CategoricalDtype) and pd.api.types.is_string_dtype(v.cat.categories)
+                   else v.astype(str).where(v.notna()) for v in present]
+        frames = [f.assign(**{col: as_text.pop(0)}) if col in f.columns else f for f in frames]
+        categories = pd.Index([], dtype=str)
+        for values in (f[col] for f in frames if col in f.columns):
+            cats = values.cat.categories if isinstance(values.dtype, pd.CategoricalDtype) else pd.Index(values.dropna().unique())
+            categories = categories.append(cats.difference(categories))
+        # sorted categories keep groupby/pivot output in the same order as plain strings
+        dtype = pd.CategoricalDtype(categories.sort_values())
+        frames = [f.assign(**{col: f[col].astype(dtype)}) if col in f.columns else f for f in frames]
+    return pd.concat(frames, ignore_index=True)
+
+def clean_marks(df: pd.DataFrame) -> pd.DataFrame:
+    """Validate and clean raw mark rows (whole file or one chunk)."""
+    required_cols = {"Name","Roll_No","Subject","Marks"}
+    if not required_cols.issubset(set(df.columns)):
+        raise ValueError(f"CSV must contain columns: {required_cols}")
+
+    # Fill attendance and other optional columns if missing
+    if "Attendance" not in df.columns:
+        df["Attendance"] = np.nan
+
+    # Convert Marks to numeric (errors -> NaN), then keep rows with all key
+    # fields present and marks in 0-100 using a single mask / single copy
+    df["Marks"] = pd.to_numeric(df["Marks"], errors="coerce")
+    keep = df["Marks"].between(0, 100) & df[["Name","Roll_No","Subject"]].notna().all(axis=1)
+    return df[keep]
+
+def subject_stats_of(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-subject count, mean, M2 (sum of squared deviations), min and max."""
+    grouped = df["Marks"].astype("float64").groupby(df["Subject"], observed=True)
+    stats = grouped.agg(["count", "mean", "min", "max"])
+    stats["m2"] = grouped.var(ddof=0) * stats["count"]
+    return stats[SUBJECT_STAT_COLS]
+
+def merge_subject_stats(a: pd.DataFrame, b: pd.DataFrame) -> pd.DataFrame:
+    """Combine two subject_stats_of() tables (Chan et al. parallel variance)."""
+    if a.empty:
+        return b
+    if b.empty:
+        return a
+    a, b = a.align(b, join="outer")
+    na, nb = a["count"].fillna(0), b["count"].fillna(0)
+    n = na + nb
+    delta = b["mean"].fillna(0) - a["mean"].fillna(0)
+    merged = pd.DataFrame(index=a.index)
+    merged["count"] = n
+    merged["mean"] = a["mean"].fillna(0) + delta * nb / n
+    # a missing side contributes nothing (its count is zero)
+    merged.loc[na == 0, "mean"] = b["mean"]
+    merged["m2"] = a["m2"].fillna(0) + b["m2"].fillna(0) + delta ** 2 * na * nb / n
+    merged["min"] = np.fmin(a["min"], b["min"])
+    merged["max"] = np.fmax(a["max"], b["max"])
+    return merged
+
+def format_subject_stats(stats: pd.DataFrame) -> pd.DataFrame:
+    """Turn running subject stats into the Subject/Mean/Min/Max/StdDev table."""
+    if stats.empty:
+        return pd.DataFrame()
+    out = pd.DataFrame({
+        "Subject": stats.index,
+        "Mean": stats["mean"].to_numpy(),
+        "Min": stats["min"].to_numpy(),
+        "Max": stats["max"].to_numpy(),
+        # sample std (ddof=1) like pandas .std(); undefined for a single mark
+        "StdDev": np.sqrt(stats["m2"] / (stats["count"] - 1)).where(stats["count"] > 1).to_numpy(),
+    })
+    return out.sort_values("Subject").reset_index(drop=True)
+
+class MarkAggregates:
+    """Running aggregates fed one cleaned chunk at a time.
+
+    Keeps only what the summaries need: each student's latest mark per
+    subject, their first recorded gender, attendance sums per Roll_No and
+    per-subject running stats -- never the full row set.
+    """
+    def __init__(self):
+        self.rows = 0
+        self.latest = pd.DataFrame()          # Roll_No, Name, Subject, Marks (last seen)
+        self._pending: List[pd.DataFrame] = []
+        self._pending_rows = 0
+        self.gender = pd.Series(dtype=object)  # (Roll_No, Name) -> first gender seen
+        self.attendance = pd.DataFrame(columns=["sum", "count"])
+        self.subjects = pd.DataFrame(columns=SUBJECT_STAT_COLS)
+
+    def update(self, chunk: pd.DataFrame):
+        if chunk.empty:
+            return
+        self.rows += len(chunk)
+        marks = chunk[STUDENT_KEYS + ["Subject", "Marks"]].drop_duplicates(STUDENT_KEYS + ["Subject"], keep="last")
+        self._pending.append(marks)
+        self._pending_rows += len(marks)
+        if self._pending_rows > max(len(self.latest), 1_000_000):
+            self._compact()
+
+        if "Gender" in chunk.columns:
+            first = chunk.drop_duplicates(STUDENT_KEYS, keep="first").set_index(STUDENT_KEYS)["Gender"]
+            new = first[~first.index.isin(self.gender.index)]
+            self.gender = pd.concat([self.gender, new]) if not self.gender.empty else first
+
+        att = chunk.groupby("Roll_No", observed=True)["Attendance"].agg(["sum", "count"])
+        self.attendance = att if self.attendance.empty else self.attendance.add(att, fill_value=0)
+
+        self.subjects = merge_subject_stats(self.subjects, subject_stats_of(chunk))
+
+    def _compact(self):
+        if self._pending:
+            parts = [self.latest] + self._pending if not self.latest.empty else self._pending
+            self.latest = pd.concat(parts, ignore_index=True).drop_duplicates(
+                STUDENT_KEYS + ["Subject"], keep="last")
+            self._pending = []
+            self._pending_rows = 0
+
+    def latest_marks(self) -> pd.DataFrame:
+        self._compact()
+        return self.latest
+
+    def attendance_by_student(self) -> pd.DataFrame:
+        att = self.attendance
+        mean = (att["sum"] / att["count"]).where(att["count"] > 0)
+        return mean.rename("Attendance").rename_axis("Roll_No").reset_index()
+
+# --------------------
+# Multi-file ingest
+# --------------------
+def resolve_inputs(source) -> List[Path]:
+    """Expand a directory (every *.csv below it) or a glob pattern into sorted paths."""
+    source = Path(source)
+    if source.is_dir():
+        return sorted(source.rglob("*.csv"))
+    if source.exists():
+        return [source]
+    # pattern relative to its first non-glob parent, e.g. data/sem*/sec_*.csv
+    parts = source.parts
+    for i, part in enumerate(parts):
+        if any(ch in part for ch in "*?["):
+            base = Path(*parts[:i]) if i else Path(".")
+            return sorted(base.glob(str(Path(*parts[i:]))))
+    return []
+
+def _ingest_file(job) -> dict:
+    """Worker: read, clean and compact one CSV. Never raises; errors are reported."""
+    path, keep_rejects = job
+    start = time.perf_counter()
+    result = {"file": str(path), "rows": 0, "kept": 0, "rejected": 0, "seconds": 0.0,
+              "error": None, "frame": None, "rejects": None}
+    try:
+        raw = pd.read_csv(path)
+        result["rows"] = len(raw)
+        cleaned = clean_marks(raw.copy())  # rejects keep the cells as read
+        result["kept"] = len(cleaned)
+        result["rejected"] = len(raw) - len(cleaned)
+        if keep_rejects and result["rejected"]:
+            result["rejects"] = raw.loc[raw.index.difference(cleaned.index)].assign(Source_File=str(path))
+        # categorical columns pickle back to the parent much smaller
+        result["frame"] = compact_frame(cleaned)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
 
 # --------------------
 # OOP Modeling
 # --------------------
 class Student:
-    """Student model storing marks per subject and metadata."""
+    """Student model storing marks per subject and metadata.
+
+    Total and average are kept up to date by add_mark (O(1), including when
+    a subject's mark is replaced), so the accessors never rescan the marks.
+    Always change marks through add_mark so the cached values stay valid.
+    """
+    __slots__ = ("name", "roll_no", "gender", "marks", "_total", "_average")
+
     def __init__(self, name: str, roll_no: str, gender: str = None):
         self.name = name
         self.roll_no = roll_no
         self.gender = gender
         self.marks: Dict[str, float] = {}  # subject -> marks
+        self._total = 0.0
+        self._average = 0.0
 
     def add_mark(self, subject: str, marks: float):
-        self.marks[subject] = float(marks)
+        marks = float(marks)
+        table = self.marks
+        previous = table.get(subject)
+        table[subject] = marks
+        total = self._total + (marks if previous is None else marks - previous)
+        self._total = total
+        self._average = total / len(table)
 
     def total(self) -> float:
-        return sum(self.marks.values()) if self.marks else 0.0
+        return self._total
 
     def average(self) -> float:
-        return self.total() / len(self.marks) if self.marks else 0.0
+        return self._average
 
     def grade(self) -> str:
-        avg = self.average()
-        if avg >= 90: return "A+"
-        if avg >= 80: return "A"
-        if avg >= 70: return "B"
-        if avg >= 60: return "C"
-        if avg >= 50: return "D"
+        avg = self._average
+        for cutoff, label in GRADE_BANDS:
+            if avg >= cutoff:
+                return label
         return "F"
 
     def to_dict(self) -> dict:
@@ -103,95 +661,529 @@ class Student:
             "Name": self.name,
             "Roll_No": self.roll_no,
             "Gender": self.gender,
-            "Total": self.total(),
-            "Average": round(self.average(),2),
+            "Total": self._total,
+            "Average": round(self._average,2),
             "Grade": self.grade()
         }
         d.update({f"Mark_{sub}": mark for sub, mark in self.marks.items()})
         return d
 
     def __str__(self):
-        return f"{self.roll_no} - {self.name} | Avg: {self.average():.2f} | Grade: {self.grade()}"
+        return f"{self.roll_no} - {self.name} | Avg: {self._average:.2f} | Grade: {self.grade()}"
+
+# --------------------
+# Ranking
+# --------------------
+class RankingIndex:
+    """Top/bottom-k selection and rank lookups over a student summary table.
+
+    top()/bottom() use np.argpartition (O(n) per query, no full sort). Rank,
+    percentile and cut-off queries use a sorted copy of the averages that
+    is built once on first use and answer in O(log n) with searchsorted.
+    Build a new index whenever the summary changes.
+    """
+    def __init__(self, summary: pd.DataFrame):
+        mark_cols = [c for c in summary.columns if c.startswith("Mark_")]
+        counts = summary[mark_cols].notna().sum(axis=1).to_numpy() if mark_cols else np.zeros(len(summary))
+        totals = summary["Total"].to_numpy(dtype="float64") if len(summary) else np.zeros(0)
+        # unrounded averages, same as Student.average()
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.averages = np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)
+        self.rolls = summary["Roll_No"].to_numpy() if len(summary) else np.zeros(0, dtype=object)
+        self._position = None
+        self._sorted = None
+
+    def __len__(self):
+        return len(self.averages)
+
+    def _order(self, idx: np.ndarray) -> np.ndarray:
+        # best first; ties keep table order (matches a stable descending sort)
+        return idx[np.lexsort((idx, -self.averages[idx]))]
+
+    def top(self, k: int) -> np.ndarray:
+        """Row positions of the k highest averages, best first."""
+        avg, n = self.averages, len(self.averages)
+        k = min(k, n)
+        if k <= 0:
+            return np.zeros(0, dtype=int)
+        kth = np.partition(avg, n - k)[n - k]
+        above = np.flatnonzero(avg > kth)
+        ties = np.flatnonzero(avg == kth)[:k - len(above)]
+        return self._order(np.concatenate([above, ties]))
+
+    def bottom(self, k: int) -> np.ndarray:
+        """Row positions of the k lowest averages, in best-first order.
+
+        Equivalent to the last k entries of a stable descending sort.
+        """
+        avg, n = self.averages, len(self.averages)
+        k = min(k, n)
+        if k <= 0:
+            return np.zeros(0, dtype=int)
+        kth = np.partition(avg, k - 1)[k - 1]
+        below = np.flatnonzero(avg < kth)
+        ties = np.flatnonzero(avg == kth)
+        ties = ties[len(ties) - (k - len(below)):]
+        return self._order(np.concatenate([below, ties]))
+
+    def _sorted_averages(self) -> np.ndarray:
+        if self._sorted is None:
+            self._sorted = np.sort(self.averages)
+        return self._sorted
+
+    @staticmethod
+    def roll_key(roll_no) -> str:
+        """Lookup key for a Roll_No: 101, 101.0, "101" and " 101 " all match."""
+        if isinstance(roll_no, float) and roll_no.is_integer():
+            roll_no = int(roll_no)
+        return str(roll_no).strip()
+
+    def position_of(self, roll_no) -> int:
+        """Row position of roll_no; numeric rolls can be looked up by their typed text."""
+        if self._position is None:
+            # a repeated Roll_No resolves to its last row, like StudentManager.students
+            self._position = {self.roll_key(roll): i for i, roll in enumerate(self.rolls)}
+        return self._position[self.roll_key(roll_no)]
+
+    def rank_of(self, roll_no: str) -> int:
+        """1-based rank by average (students with equal averages share a rank)."""
+        avg = self.averages[self.position_of(roll_no)]
+        higher = len(self) - np.searchsorted(self._sorted_averages(), avg, side="right")
+        return int(higher) + 1
+
+    def percentile_of(self, roll_no: str) -> float:
+        """Percentage of students whose average is at or below this student's."""
+        avg = self.averages[self.position_of(roll_no)]
+        at_or_below = np.searchsorted(self._sorted_averages(), avg, side="right")
+        return float(100.0 * at_or_below / len(self))
+
+    def cutoff(self, top_percent: float) -> float:
+        """Lowest average that still falls within the top `top_percent` % of students."""
+        if not len(self):
+            return float("nan")
+        count = max(1, int(np.ceil(len(self) * top_percent / 100.0)))
+        return float(self._sorted_averages()[len(self) - min(count, len(self))])
 
 # --------------------
 # Manager
 # --------------------
 class StudentManager:
     def __init__(self):
-        self.students: Dict[str, Student] = {}  # roll_no -> Student
+        self._students: Dict[str, Student] = {}  # roll_no -> Student, built on demand
+        self._students_complete = False  # True once every summary row has its Student
         self.df: pd.DataFrame = pd.DataFrame()
+        self.summary: pd.DataFrame = pd.DataFrame()  # one row per student (see summarize_marks)
+        # chunked (out-of-core) mode: df stays empty and aggregates hold the state
+        self.aggregates: MarkAggregates = None
+        self.source_path: Path = None
+        self.chunksize: int = None
+        self.head: pd.DataFrame = pd.DataFrame()  # first cleaned rows, for previews
+        self._ranking: RankingIndex = None  # rebuilt lazily after the summary changes
+        # incremental state maintained by append_marks()
+        self._subject_stats: pd.DataFrame = None   # running count/mean/m2/min/max per subject
+        self._grade_counts: pd.Series = None
+        self._summary_rows: Dict[tuple, int] = None  # (Roll_No, Name) as str -> summary position
+        self.appended: List[pd.DataFrame] = []     # rows appended in chunked mode
+        self.last_appended: pd.DataFrame = pd.DataFrame()
+        self.unexported: List[pd.DataFrame] = []   # appended batches not yet in the cleaned CSV
+        self.ingest_report: List[dict] = []          # per-file results of load_many()
+        self.export_settings: dict = {}  # compression/columnar of the last export_outputs() of this data
 
-    def load_csv(self, path: Path):
-        try:
-            df = safe_read_csv(path)
-        except Exception:
-            raise
-        # Basic validations & cleaning
-        required_cols = {"Name","Roll_No","Subject","Marks"}
-        if not required_cols.issubset(set(df.columns)):
-            raise ValueError(f"CSV must contain columns: {required_cols}")
-
-        # Fill attendance and other optional columns if missing
-        if "Attendance" not in df.columns:
-            df["Attendance"] = np.nan
-
-        # Convert Marks to numeric, coerce errors to NaN then drop rows
-        df["Marks"] = pd.to_numeric(df["Marks"], errors="coerce")
-        df = df.dropna(subset=["Marks","Name","Roll_No","Subject"])
-        # Ensure marks in 0-100
-        df = df[(df["Marks"] >= 0) & (df["Marks"] <= 100)]
-        # store cleaned df
-        self.df = df.copy()
-        logging.info("CSV cleaned and loaded into manager.")
+    @property
+    def ranking(self) -> RankingIndex:
+        if self._ranking is None:
+            self._ranking = RankingIndex(self.summary)
+        return self._ranking
+
+    @property
+    def df(self) -> pd.DataFrame:
+        """Cleaned mark rows; rows from append_marks() are concatenated on first access."""
+        if self._pending_rows:
+            self._df = concat_frames([self._df] + self._pending_rows)
+            self._pending_rows = []
+        return self._df
+
+    @df.setter
+    def df(self, value: pd.DataFrame):
+        self._df = value
+        self._pending_rows: List[pd.DataFrame] = []
+
+    @property
+    def has_data(self) -> bool:
+        return (not self._df.empty or bool(self._pending_rows)
+                or (self.aggregates is not None and self.aggregates.rows > 0))
+
+    def iter_clean_chunks(self):
+        """Yield cleaned chunks of the loaded source file (chunked mode)."""
+        for chunk in safe_read_csv(self.source_path, chunksize=self.chunksize):
+            yield clean_marks(chunk)
+        yield from self.appended
+
+    @property
+    def students(self) -> Dict[str, Student]:
+        """All Student objects, created from the summary table on first access.
 
+        A Roll_No that appears on several rows maps to its last row, the
+        same row get_student() and rank_report() use.
+        """
+        if not self._students_complete:
+            missing = {}
+            for record in self.summary.to_dict("records"):
+                if record["Roll_No"] not in self._students:
+                    missing[record["Roll_No"]] = record  # last row wins
+            for roll_no, record in missing.items():
+                self._students[roll_no] = self._student_from_record(record)
+            self._students_complete = True
+        return self._students
+
+    @staticmethod
+    def _student_from_record(record: dict) -> Student:
+        gender = record.get("Gender")
+        student = Student(name=record["Name"], roll_no=record["Roll_No"],
+                          gender=None if pd.isna(gender) else gender)
+        for col, value in record.items():
+            if col.startswith("Mark_") and not pd.isna(value):
+                student.add_mark(col[len("Mark_"):], value)
+        return student
+
+    def get_student(self, roll_no: str) -> Student:
+        """Return one Student, building only that object if needed."""
+        if roll_no not in self._students:
+            if self.summary.empty:
+                raise KeyError(roll_no)
+            return self._student_at(self.ranking.position_of(roll_no))
+        return self._students[roll_no]
+
+    def _student_at(self, position: int) -> Student:
+        roll_no = self.summary["Roll_No"].iat[position]
+        if roll_no not in self._students:
+            # always build from the roll's last row so `students` agrees
+            position = self.ranking.position_of(roll_no)
+            self._students[roll_no] = self._student_from_record(self.summary.iloc[position].to_dict())
+        return self._students[roll_no]
+
+    def _reset_derived(self):
+        """Forget everything computed from previously loaded data."""
+        self.summary = pd.DataFrame()
+        self._students = {}
+        self._students_complete = False
+        self._ranking = None
+        self._subject_stats = None
+        self._grade_counts = None
+        self._summary_rows = None
+        self.appended = []
+        self.unexported = []
+        self.export_settings = {}  # the files on disk no longer match the loaded data
+
+    @profiled("load_csv", rows=_loaded_rows)
+    def load_csv(self, path: Path, chunksize: int = None, use_cache: bool = False):
+        """Load and clean a marks CSV.
+
+        With chunksize, the file is read and cleaned chunk by chunk and only
+        running aggregates are kept (self.df stays empty), so files larger
+        than memory can be summarised and exported. With use_cache (whole
+        file mode), the cleaned frame is stored in CACHE_DIR with categorical
+        and narrowed dtypes and reused while the source is unchanged.
+        """
+        self._reset_derived()
+        if chunksize:
+            self.df = pd.DataFrame()
+            self.aggregates = MarkAggregates()
+            self.source_path, self.chunksize = Path(path), chunksize
+            self.head = pd.DataFrame()
+            for chunk in self.iter_clean_chunks():
+                if self.head.empty:
+                    self.head = chunk.head(10)
+                self.aggregates.update(chunk)
+            logger.info(f"CSV cleaned in chunks of {chunksize}: {self.aggregates.rows} rows aggregated.")
+            return
+        self.aggregates = None
+        self.source_path, self.chunksize = None, None
+        df = load_frame_cache(path) if use_cache else None
+        if df is None:
+            df = clean_marks(safe_read_csv(path))
+            if use_cache:
+                df = compact_frame(df)
+                try:
+                    save_frame_cache(df, path)
+                except OSError as e:
+                    logger.warning(f"Could not write cache for {path}: {e}")
+        self.df = df
+        self.head = self.df.head(10)
+        logger.info("CSV cleaned and loaded into manager.")
+
+    def load_many(self, source, workers: int = None, rejects_path: Path = None) -> List[dict]:
+        """Load a directory or glob of CSVs (e.g. one per section per semester).
+
+        Files are read and cleaned in a process pool, then concatenated with
+        their categorical columns aligned. Returns one report entry per file
+        (rows, kept, rejected, seconds, error); rejected rows can be saved to
+        rejects_path with a Source_File column.
+        """
+        from concurrent.futures import ProcessPoolExecutor
+
+        paths = resolve_inputs(source)
+        if not paths:
+            raise FileNotFoundError(f"No CSV files match {source}")
+        start = time.perf_counter()
+        jobs = [(path, rejects_path is not None) for path in paths]
+        if workers is None:
+            workers = min(len(jobs), os.cpu_count() or 1)
+        if workers <= 1 or len(jobs) == 1:
+            results = [_ingest_file(job) for job in jobs]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(_ingest_file, jobs))
+
+        self._reset_derived()
+        self.aggregates = None
+        self.source_path, self.chunksize = None, None
+        self.df = concat_frames([r["frame"] for r in results if r["frame"] is not None])
+        self.head = self.df.head(10)
+        rejects = [r["rejects"] for r in results if r["rejects"] is not None]
+        if rejects_path is not None and rejects:
+            pd.concat(rejects, ignore_index=True).to_csv(rejects_path, index=False)
+            logger.info(f"Rejected rows written to {rejects_path}")
+
+        report = [{k: v for k, v in r.items() if k not in ("frame", "rejects")} for r in results]
+        for entry in report:
+            if entry["error"]:
+                logger.error(f"{entry['file']}: {entry['error']}")
+            else:
+                logger.info(f"{entry['file']}: {entry['kept']}/{entry['rows']} rows kept, "
+                             f"{entry['rejected']} rejected in {entry['seconds']:.3f}s")
+        logger.info(f"Ingested {len(self.df)} rows from {len(paths)} files "
+                     f"in {time.perf_counter() - start:.3f}s using {workers} worker(s).")
+        self.ingest_report = report
+        return report
+
+    @profiled("build_students", rows=_summary_rows)
     def build_students(self):
-        if self.df.empty:
-            logging.error("No loaded DataFrame to build students from.")
+        """Compute every student's totals, averages and grades in one vectorized pass.
+
+        Student objects are not created here; use `students` or get_student().
+        """
+        if not self.has_data:
+            logger.error("No loaded DataFrame to build students from.")
             return
-        grouped = self.df.groupby(["Roll_No","Name"])
-        for (roll, name), g in grouped:
-            gender = g.get("Gender", pd.Series([None])).iloc[0] if "Gender" in g else None
-            student = Student(name=name, roll_no=roll, gender=gender)
-            for _, row in g.iterrows():
-                student.add_mark(row["Subject"], row["Marks"])
-            self.students[roll] = student
-        logging.info(f"Built {len(self.students)} Student objects.")
+        if self.aggregates is not None:
+            self.summary = summarize_marks(self.aggregates.latest_marks(), gender=self.aggregates.gender)
+        else:
+            self.summary = summarize_marks(self.df)
+        self._students = {}
+        self._students_complete = False
+        self._ranking = None
+        self._grade_counts = None
+        self._summary_rows = None
+        logger.info(f"Built summary for {len(self.summary)} students.")
 
+    @profiled("student_summary_df", rows=_result_rows)
     def student_summary_df(self) -> pd.DataFrame:
-        rows = [s.to_dict() for s in self.students.values()]
-        df_summary = pd.DataFrame(rows)
-        # reorder columns
-        cols = ["Roll_No","Name","Gender"] + [c for c in df_summary.columns if c.startswith("Mark_")] + ["Total","Average","Grade"]
-        cols = [c for c in cols if c in df_summary.columns]
-        return df_summary[cols]
+        if self.summary.empty:
+            return pd.DataFrame()
+        return self.summary.copy()
 
     def top_bottom_performers(self, top_n=3) -> Tuple[List[Student], List[Student]]:
-        students_sorted = sorted(self.students.values(), key=lambda s: s.average(), reverse=True)
-        top = students_sorted[:top_n]
-        bottom = students_sorted[-top_n:] if len(students_sorted) >= top_n else students_sorted[::-1]
+        ranking = self.ranking
+        top = [self._student_at(i) for i in ranking.top(top_n)]
+        if len(ranking) >= top_n:
+            bottom = [self._student_at(i) for i in ranking.bottom(top_n)]
+        else:
+            bottom = top[::-1]
         return top, bottom
 
+    def rank_report(self, roll_no: str) -> dict:
+        """Rank, percentile and average for one student (O(log n) after the first query)."""
+        ranking = self.ranking
+        position = ranking.position_of(roll_no)
+        return {
+            "Roll_No": roll_no,
+            "Average": round(float(ranking.averages[position]), 2),
+            "Rank": ranking.rank_of(roll_no),
+            "Of": len(ranking),
+            "Percentile": round(ranking.percentile_of(roll_no), 2),
+        }
+
+    def _summary_positions(self) -> Dict[tuple, int]:
+        if self._summary_rows is None:
+            keys = zip(self.summary["Roll_No"].astype(str), self.summary["Name"].astype(str))
+            self._summary_rows = {key: i for i, key in enumerate(keys)}
+        return self._summary_rows
+
+    def append_marks(self, rows: pd.DataFrame) -> dict:
+        """Add new mark rows (e.g. the next Semester) without rebuilding everything.
+
+        Only the summary rows of students present in `rows` are updated (in
+        place, found through a (Roll_No, Name) position map); new students
+        are appended at the end. Per-subject stats are merged in with the
+        parallel Welford update and the grade distribution is adjusted by the
+        affected students' old and new grades. The raw rows are queued and
+        only concatenated onto self.df when it is next read. Returns counts
+        of the rows, students and subjects touched.
+        """
+        if self.summary.empty and self.has_data:
+            self.build_students()
+        new = clean_marks(rows.copy()).reset_index(drop=True)
+        keys = STUDENT_KEYS
+        if self.aggregates is not None:
+            self.aggregates.update(new)
+            self.appended.append(new)
+        else:
+            if self._subject_stats is None:
+                self._subject_stats = subject_stats_of(self.df) if not self.df.empty else pd.DataFrame()
+            self._subject_stats = merge_subject_stats(self._subject_stats, subject_stats_of(new))
+            self._pending_rows.append(new)
+        self.last_appended = new
+        self.unexported.append(new)
+        if new.empty:
+            return {"rows": 0, "students": 0, "new_students": 0, "subjects": []}
+        subjects = sorted(new["Subject"].astype(str).unique())
+        if self.summary.empty:
+            self.build_students()
+            return {"rows": len(new), "students": len(self.summary), "new_students": len(self.summary),
+                    "subjects": subjects}
+
+        # updated marks for just the affected students
+        latest = new.drop_duplicates(keys + ["Subject"], keep="last")
+        update = latest.pivot(index=keys, columns="Subject", values="Marks").astype(float)
+        update.columns = [f"Mark_{sub}" for sub in update.columns]
+
+        summary = self.summary
+        for col in update.columns:
+            if col not in summary.columns:  # first marks in a new subject
+                summary.insert(summary.columns.get_loc("Total"), col, np.nan)
+        mark_cols = [c for c in summary.columns if c.startswith("Mark_")]
+        positions = self._summary_positions()
+        found = [positions.get((str(roll), str(name))) for roll, name in update.index]
+        is_old = np.array([p is not None for p in found], dtype=bool)
+        old_pos = np.array([p for p in found if p is not None], dtype=np.intp)
+
+        merged = update.reindex(columns=mark_cols)
+        if len(old_pos):
+            old_marks = summary[mark_cols].to_numpy(dtype=float)[old_pos]
+            values = merged.to_numpy(copy=True)
+            block = values[is_old]
+            values[is_old] = np.where(np.isnan(block), old_marks, block)
+            merged = pd.DataFrame(values, index=merged.index, columns=mark_cols)
+        total = merged.sum(axis=1).to_numpy()
+        average = total / merged.count(axis=1).to_numpy()
+        grades = grade_array(average)
+
+        counts = self.grade_distribution()
+        if len(old_pos):
+            counts = counts.sub(summary["Grade"].iloc[old_pos].value_counts(), fill_value=0)
+        counts = counts.add(pd.Series(grades).value_counts(), fill_value=0)
+        self._grade_counts = counts[counts > 0].astype(int)
+
+        if len(old_pos):
+            fresh = merged.to_numpy()[is_old]
+            for j, col in enumerate(mark_cols):
+                summary.iloc[old_pos, summary.columns.get_loc(col)] = fresh[:, j]
+            summary.iloc[old_pos, summary.columns.get_loc("Total")] = total[is_old]
+            summary.iloc[old_pos, summary.columns.get_loc("Average")] = average[is_old].round(2)
+            summary.iloc[old_pos, summary.columns.get_loc("Grade")] = grades[is_old]
+        added = ~is_old
+        if added.any():
+            added_keys = update.index[added]
+            rows_new = pd.DataFrame({"Roll_No": added_keys.get_level_values(0),
+                                     "Name": added_keys.get_level_values(1)})
+            if "Gender" in new.columns:
+                gender = new.drop_duplicates(keys, keep="first").set_index(keys)["Gender"]
+                rows_new["Gender"] = gender.reindex(added_keys).to_numpy(dtype=object)
+            else:
+                rows_new["Gender"] = None
+            for j, col in enumerate(mark_cols):
+                rows_new[col] = merged.to_numpy()[added, j]
+            rows_new["Total"] = total[added]
+            rows_new["Average"] = average[added].round(2)
+            rows_new["Grade"] = grades[added]
+            base = len(summary)
+            rows_new = rows_new[list(summary.columns)]
+            for col in summary.columns:
+                if isinstance(summary[col].dtype, pd.CategoricalDtype):
+                    # growing categories is slow; switch the column to plain
+                    # strings once so later appends are a cheap concat
+                    summary[col] = summary[col].astype(str).where(summary[col].notna())
+                    rows_new[col] = rows_new[col].astype(str).where(rows_new[col].notna())
+            summary = pd.concat([summary, rows_new], ignore_index=True)
+            for i, (roll, name) in enumerate(added_keys):
+                positions[(str(roll), str(name))] = base + i
+        self.summary = summary
+        self._ranking = None
+        if added.any() and self._students:
+            # a new row is now the last one for its Roll_No
+            for i, roll in enumerate(added_keys.get_level_values(0)):
+                if self._students_complete or roll in self._students:
+                    self._students[roll] = self._student_from_record(summary.iloc[base + i].to_dict())
+
+        # keep already-built Student objects in step with O(1) add_mark calls
+        if self._students:
+            for roll, name, subject, mark in latest[keys + ["Subject", "Marks"]].itertuples(index=False):
+                student = self._students.get(roll)
+                if student is not None and student.name == name:
+                    student.add_mark(subject, mark)
+        logger.info(f"Appended {len(new)} rows affecting {len(update)} students.")
+        return {"rows": len(new), "students": len(update), "new_students": int(added.sum()),
+                "subjects": subjects}
+
+    def append_csv(self, path: Path) -> dict:
+        """Read a CSV of new mark rows and append_marks() it."""
+        return self.append_marks(safe_read_csv(path))
+
+    def grade_distribution(self) -> pd.Series:
+        """Number of students per grade (kept up to date by append_marks)."""
+        if self._grade_counts is None:
+            if self.summary.empty:
+                return pd.Series(dtype=int)
+            self._grade_counts = self.summary["Grade"].value_counts()
+        return self._grade_counts
+
+    def attendance_by_student(self) -> pd.DataFrame:
+        """Mean attendance per Roll_No (columns Roll_No, Attendance)."""
+        if self.aggregates is not None:
+            return self.aggregates.attendance_by_student()
+        return self.df.groupby("Roll_No", observed=True)["Attendance"].mean().reset_index()
+
+    @profiled("subject_wise_stats", rows=_result_rows)
     def subject_wise_stats(self) -> pd.DataFrame:
         # subject level mean, min, max
+        if self.aggregates is not None:
+            return format_subject_stats(self.aggregates.subjects)
+        if self._subject_stats is not None:
+            return format_subject_stats(self._subject_stats)
         if self.df.empty:
             return pd.DataFrame()
-        stats = self.df.groupby("Subject")["Marks"].agg(["mean","min","max","std"]).reset_index()
+        marks = self.df["Marks"].astype("float64")
+        stats = marks.groupby(self.df["Subject"], observed=True).agg(["mean","min","max","std"]).reset_index()
         stats = stats.rename(columns={"mean":"Mean","min":"Min","max":"Max","std":"StdDev"})
         return stats
 
 # --------------------
 # Visualization
 # --------------------
-def create_dashboard(manager: StudentManager, out_path: Path = DASHBOARD_PNG):
+# Above this many students the per-student bar and scatter panels switch to
+# aggregated views (histogram / hexbin) that stay readable and fast to draw.
+LARGE_COHORT = 200
+
+@profiled("create_dashboard", rows=_summary_rows)
+def create_dashboard(manager: StudentManager, out_path: Path = None, title: str = None,
+                     max_individual: int = LARGE_COHORT):
     """Create 2x2 subplot dashboard:
-      1) Bar: Average marks by student
+      1) Bar: Average marks by student (histogram of averages for large cohorts)
       2) Pie: Grade distribution
       3) Line: Subject-wise average (trend across subjects)
-      4) Scatter: Attendance vs Average marks (if attendance present)
+      4) Scatter: Attendance vs Average marks (if attendance present;
+         hexbin density for large cohorts)
     """
-    df_summary = manager.student_summary_df()
+    import matplotlib
+    if "matplotlib.pyplot" not in sys.modules:
+        matplotlib.use("Agg")  # file output only; no GUI backend needed
+    import matplotlib.pyplot as plt
+
+    out_path = Path(out_path or DASHBOARD_PNG)
+    df_summary = manager.summary
     if df_summary.empty:
-        logging.error("No summary data to plot.")
+        logger.error("No summary data to plot.")
         return
 
     # Bar chart: Average by student
@@ -199,33 +1191,39 @@ def create_dashboard(manager: StudentManager, out_path: Path = DASHBOARD_PNG):
     y = df_summary["Average"]
 
     # Pie: grade distribution
-    grade_counts = df_summary["Grade"].value_counts()
+    grade_counts = manager.grade_distribution()
 
     # Subject-wise average
     subj_stats = manager.subject_wise_stats()
     subj_mean = subj_stats[["Subject","Mean"]] if not subj_stats.empty else None
 
     # Attendance vs Average if Attendance exists in original df
-    attendance_exists = "Attendance" in manager.df.columns
+    attendance_exists = manager.aggregates is not None or "Attendance" in manager.df.columns
     attendance_df = None
     if attendance_exists:
         # compute attendance by Roll_No (mean)
-        attendance_df = manager.df.groupby("Roll_No")["Attendance"].mean().reset_index()
+        attendance_df = manager.attendance_by_student()
         # join to summary
         att_join = df_summary.merge(attendance_df, on="Roll_No", how="left")
     else:
-        att_join = df_summary.copy()
-        att_join["Attendance"] = np.nan
+        att_join = df_summary.assign(Attendance=np.nan)
+    large = len(df_summary) > max_individual
 
     # Create figure
     fig, axes = plt.subplots(2,2, figsize=(14,10))
     plt.subplots_adjust(hspace=0.4, wspace=0.3)
 
-    # 1 Bar chart
-    axes[0,0].bar(x, y)
-    axes[0,0].set_title("Average Marks by Student")
-    axes[0,0].set_ylabel("Average Marks")
-    axes[0,0].tick_params(axis='x', rotation=45)
+    # 1 Bar chart (binned for large cohorts: one bar per 5-mark band)
+    if large:
+        axes[0,0].hist(y.to_numpy(dtype=float), bins=np.arange(0, 105, 5), edgecolor="white")
+        axes[0,0].set_title(f"Distribution of Student Averages (n={len(df_summary)})")
+        axes[0,0].set_xlabel("Average Marks")
+        axes[0,0].set_ylabel("Students")
+    else:
+        axes[0,0].bar(x.astype(str), y)
+        axes[0,0].set_title("Average Marks by Student")
+        axes[0,0].set_ylabel("Average Marks")
+        axes[0,0].tick_params(axis='x', rotation=45)
 
     # 2 Pie chart
     axes[0,1].pie(grade_counts.values, labels=grade_counts.index, autopct="%1.1f%%", startangle=90)
@@ -240,39 +1238,237 @@ def create_dashboard(manager: StudentManager, out_path: Path = DASHBOARD_PNG):
     else:
         axes[1,0].text(0.5,0.5,"No subject stats available", ha='center')
 
-    # 4 Scatter Attendance vs Average
-    axes[1,1].scatter(att_join["Attendance"], att_join["Average"])
+    # 4 Scatter Attendance vs Average (hexbin density for large cohorts)
+    att = att_join["Attendance"].to_numpy(dtype=float)
+    avg = att_join["Average"].to_numpy(dtype=float)
+    if large and np.isfinite(att).any():
+        known = np.isfinite(att) & np.isfinite(avg)
+        hb = axes[1,1].hexbin(att[known], avg[known], gridsize=40, mincnt=1, cmap="viridis")
+        fig.colorbar(hb, ax=axes[1,1], label="Students")
+    else:
+        axes[1,1].scatter(att, avg)
     axes[1,1].set_title("Attendance vs Average Marks")
     axes[1,1].set_xlabel("Attendance (%)")
     axes[1,1].set_ylabel("Average Marks")
 
-    fig.suptitle("Student Performance Dashboard", fontsize=16)
+    fig.suptitle(title or "Student Performance Dashboard", fontsize=16)
     plt.tight_layout(rect=[0,0,1,0.96])
+    out_path.parent.mkdir(parents=True, exist_ok=True)
     fig.savefig(out_path)
-    logging.info(f"Dashboard saved to {out_path}")
+    plt.close(fig)
+    logger.info(f"Dashboard saved to {out_path}")
+
+def _render_group_dashboard(job) -> Tuple[str, float]:
+    """Worker: build one group's summary and render its dashboard with Agg."""
+    rows, out_path, title, max_individual = job
+    import matplotlib
+    matplotlib.use("Agg", force=True)
+    start = time.perf_counter()
+    manager = StudentManager()
+    manager.df = rows
+    manager.build_students()
+    create_dashboard(manager, out_path=out_path, title=title, max_individual=max_individual)
+    return str(out_path), time.perf_counter() - start
+
+def create_group_dashboards(manager: StudentManager, by: str = "Semester", out_dir: Path = None,
+                            workers: int = None, max_individual: int = LARGE_COHORT) -> List[Tuple[str, float]]:
+    """Render one dashboard per value of `by` (e.g. Semester or a department column).
+
+    Groups are rendered in parallel in a process pool using the Agg backend.
+    Needs whole-file data (manager.df), not chunked mode. Returns
+    (path, seconds) for each dashboard written.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if manager.df.empty:
+        raise ValueError("create_group_dashboards needs data loaded without chunksize.")
+    if by not in manager.df.columns:
+        raise ValueError(f"Column {by!r} not found in the loaded data.")
+    out_dir = Path(out_dir or OUTPUT_DIR / f"dashboards_by_{by}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    jobs = []
+    for value, rows in manager.df.groupby(by, observed=True, sort=True):
+        label = str(value).replace(os.sep, "_")
+        jobs.append((rows, out_dir / f"dashboard_{by}_{label}.png",
+                     f"Student Performance Dashboard - {by} {value}", max_individual))
+    if workers is None:
+        workers = min(len(jobs), os.cpu_count() or 1)
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_render_group_dashboard(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_render_group_dashboard, jobs))
+    for path, seconds in results:
+        logger.info(f"Dashboard saved to {path} in {seconds:.2f}s")
+    return results
 
 # --------------------
 # Reporting & Export
 # --------------------
-def export_outputs(manager: StudentManager):
-    # cleaned df
-    manager.df.to_csv(CLEANED_CSV, index=False)
-    logging.info(f"Cleaned data exported to {CLEANED_CSV}")
+EXPORT_COMPRESSION = {None: "", "gzip": ".gz", "zstd": ".zst"}  # method -> file suffix
+COLUMNAR_FORMATS = (None, "npz", "parquet")
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError("zstd export needs the 'zstandard' package (pip install zstandard).") from None
+    return zstandard
+
+def _open_text(path: Path, compression: str = None, mode: str = "w"):
+    """Text handle for path ("r", "w" or "a"), streaming through gzip/zstd when asked.
 
-    # summary csv
-    summary_df = manager.student_summary_df()
-    summary_df.to_csv(SUMMARY_CSV, index=False)
-    logging.info(f"Student summary exported to {SUMMARY_CSV}")
+    Appending to a compressed file adds a new gzip member / zstd frame,
+    which readers decode as one continuous stream.
+    """
+    if compression is None:
+        return open(path, mode, newline="")
+    if compression == "gzip":
+        import gzip
+        return gzip.open(path, mode + "t", newline="", compresslevel=6)
+    if compression == "zstd":
+        return _zstandard().open(path, mode + "t", newline="")
+    raise ValueError(f"Unknown compression {compression!r}; use one of {list(EXPORT_COMPRESSION)}")
+
+def write_csv_stream(frames, path: Path, compression: str = None):
+    """Write an iterable of frames as one CSV (header once), optionally compressed."""
+    with _open_text(path, compression) as f:
+        header = True
+        for frame in frames:
+            frame.to_csv(f, index=False, header=header)
+            header = False
+
+def write_columnar(df: pd.DataFrame, path: Path, fmt: str):
+    """Write df as .npz (numpy only) or .parquet (needs pyarrow or fastparquet)."""
+    if fmt == "npz":
+        with open(path, "wb") as f:
+            np.savez(f, **frame_arrays(df, {"version": CACHE_VERSION}))
+    elif fmt == "parquet":
+        df.to_parquet(path, index=False)
+    else:
+        raise ValueError(f"Unknown columnar format {fmt!r}; use one of {list(COLUMNAR_FORMATS[1:])}")
+
+def write_atomic(artifact: str, path: Path, write) -> dict:
+    """Run write(tmp_path), then move it over path so readers never see a partial file."""
+    start = time.perf_counter()
+    path = Path(path)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    entry = {"artifact": artifact, "path": str(path), "bytes": path.stat().st_size,
+             "seconds": round(time.perf_counter() - start, 6)}
+    logger.info(f"{artifact} exported to {path} ({entry['bytes']:,} bytes in {entry['seconds']:.3f}s)")
+    return entry
+
+@profiled("export_outputs", rows=_loaded_rows)
+def export_outputs(manager: StudentManager, compression: str = None, columnar: str = None,
+                   workers: int = None) -> List[dict]:
+    """Write the cleaned data, student summary and text report.
+
+    The summary frame and top/bottom performers are computed once, then
+    every artifact is written concurrently in a thread pool, each to a temp
+    file that is renamed into place. compression ("gzip"/"zstd") streams the
+    CSVs through the compressor (adding .gz/.zst); columnar ("npz"/"parquet")
+    adds columnar copies of the summary and, in whole-file mode, the cleaned
+    data. Returns one {artifact, path, bytes, seconds} entry per file.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    if compression not in EXPORT_COMPRESSION:
+        raise ValueError(f"Unknown compression {compression!r}; use one of {list(EXPORT_COMPRESSION)}")
+    if columnar not in COLUMNAR_FORMATS:
+        raise ValueError(f"Unknown columnar format {columnar!r}; use one of {list(COLUMNAR_FORMATS[1:])}")
+    if compression == "zstd":
+        _zstandard()  # fail before any file is written
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    summary_df = manager.summary
+    # Student objects are created lazily, so build these before the threads start.
+    top_bottom = manager.top_bottom_performers(top_n=3)
+    suffix = EXPORT_COMPRESSION[compression]
+    # cleaned df (re-streamed from the source file in chunked mode)
+    chunked = manager.aggregates is not None
+    frames = manager.iter_clean_chunks() if chunked else [manager.df]
+    jobs = [
+        ("cleaned_csv", Path(f"{CLEANED_CSV}{suffix}"), lambda tmp: write_csv_stream(frames, tmp, compression)),
+        ("summary_csv", Path(f"{SUMMARY_CSV}{suffix}"), lambda tmp: write_csv_stream([summary_df], tmp, compression)),
+        ("summary_txt", SUMMARY_TXT, lambda tmp: write_summary_txt(manager, summary_df, tmp, top_bottom)),
+    ]
+    if columnar:
+        jobs.append(("summary_" + columnar, SUMMARY_CSV.with_suffix("." + columnar),
+                     lambda tmp: write_columnar(summary_df, tmp, columnar)))
+        if not chunked:
+            jobs.append(("cleaned_" + columnar, CLEANED_CSV.with_suffix("." + columnar),
+                         lambda tmp: write_columnar(manager.df, tmp, columnar)))
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers or len(jobs)) as pool:
+        futures = [pool.submit(write_atomic, name, path, write) for name, path, write in jobs]
+        report = [f.result() for f in futures]
+    logger.info(f"Exported {len(report)} files ({sum(e['bytes'] for e in report):,} bytes) "
+                f"in {time.perf_counter() - start:.3f}s")
+    manager.export_settings = {"compression": compression, "columnar": columnar}
+    manager.unexported = []
+    return report
+
+def export_appended(manager: StudentManager):
+    """Refresh the outputs after append_marks() without redoing the full export.
 
+    Uses the compression and columnar settings of the last export_outputs()
+    call for the loaded data. Every batch appended since the last export is
+    added to the end of the cleaned CSV (as a new gzip member / zstd frame
+    when compressed); the summary CSV, text report and any columnar copies are rewritten from the already-updated
+    summary (changed rows can't be patched in place). Falls back to
+    export_outputs() if this data hasn't been exported yet or there is no
+    compatible cleaned CSV.
+    """
+    settings = manager.export_settings
+    if not settings:
+        return export_outputs(manager)
+    compression, columnar = settings.get("compression"), settings.get("columnar")
+    suffix = EXPORT_COMPRESSION[compression]
+    cleaned = Path(f"{CLEANED_CSV}{suffix}")
+    pending = manager.unexported
+    new = concat_frames(pending) if pending else pd.DataFrame()
+    if not cleaned.exists():
+        return export_outputs(manager, **settings)
+    with _open_text(cleaned, compression, "r") as f:
+        header = next(csv.reader(f), [])
+    if not new.empty and header != [str(c) for c in new.columns]:
+        return export_outputs(manager, **settings)
+    if not new.empty:
+        with _open_text(cleaned, compression, "a") as f:
+            new.to_csv(f, header=False, index=False)
+        logger.info(f"Appended {len(new)} rows to {cleaned}")
+    manager.unexported = []
+    summary_df = manager.summary
+    report = [
+        write_atomic("summary_csv", Path(f"{SUMMARY_CSV}{suffix}"),
+                     lambda tmp: write_csv_stream([summary_df], tmp, compression)),
+        write_atomic("summary_txt", SUMMARY_TXT, lambda tmp: write_summary_txt(manager, summary_df, tmp)),
+    ]
+    if columnar:
+        report.append(write_atomic("summary_" + columnar, SUMMARY_CSV.with_suffix("." + columnar),
+                                   lambda tmp: write_columnar(summary_df, tmp, columnar)))
+        if manager.aggregates is None:
+            report.append(write_atomic("cleaned_" + columnar, CLEANED_CSV.with_suffix("." + columnar),
+                                       lambda tmp: write_columnar(manager.df, tmp, columnar)))
+    return report
+
+def write_summary_txt(manager: StudentManager, summary_df: pd.DataFrame, path: Path = None,
+                      top_bottom: Tuple[List[Student], List[Student]] = None):
     # textual summary
-    top, bottom = manager.top_bottom_performers(top_n=3)
+    path = Path(path or SUMMARY_TXT)
+    top, bottom = top_bottom or manager.top_bottom_performers(top_n=3)
     total_consumption = summary_df["Total"].sum() if "Total" in summary_df.columns else 0
     class_avg = summary_df["Average"].mean() if "Average" in summary_df.columns else 0
 
-    with open(SUMMARY_TXT, "w") as f:
+    with open(path, "w") as f:
         f.write("Performance Summary Report\n")
         f.write("=========================\n")
-        f.write(f"Total students: {len(manager.students)}\n")
+        f.write(f"Total students: {len(summary_df)}\n")
         f.write(f"Class Average (Avg of student averages): {class_avg:.2f}\n")
         f.write("\nTop performers:\n")
         for s in top:
@@ -280,12 +1476,17 @@ def export_outputs(manager: StudentManager):
         f.write("\nBottom performers:\n")
         for s in bottom:
             f.write(f"- {s.roll_no} | {s.name} : Avg {s.average():.2f}\n")
-    logging.info(f"Text summary exported to {SUMMARY_TXT}")
 
 # --------------------
 # CLI
 # --------------------
-def run_cli():
+def run_cli(profile: bool = None):
+    """Interactive menu. profile=None follows STUDENT_ANALYZER_PROFILE."""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
+    if profile is None:
+        profiling_from_env()
+    elif profile:
+        enable_profiling()
     ensure_sample_data()
     manager = StudentManager()
     print("Smart Student Performance Analyzer (Capstone)\n")
@@ -300,6 +1501,10 @@ def run_cli():
         print("5. Create dashboard and save")
         print("6. Export outputs (CSV + summary)")
         print("7. Quick run (load sample -> build -> export -> dashboard)")
+        print("8. Rank lookup by Roll No")
+        print("9. Append new marks CSV (e.g. next semester)")
+        print("10. Load a folder or glob of CSVs (parallel)")
+        print("11. Dashboards per group (e.g. Semester), rendered in parallel")
         print("0. Exit")
         choice = input("Enter choice: ").strip()
 
@@ -310,53 +1515,98 @@ def run_cli():
                     path = SAMPLE_CSV
                 else:
                     path = Path(path_input)
-                manager.load_csv(Path(path))
+                chunk_input = input("Chunk size for large files (blank = load whole file): ").strip()
+                if chunk_input:
+                    manager.load_csv(Path(path), chunksize=int(chunk_input))
+                else:
+                    manager.load_csv(Path(path), use_cache=True)
                 print("Dataset loaded and cleaned.")
             elif choice == "2":
-                if manager.df.empty:
+                if not manager.has_data:
                     print("No data loaded. Use option 1.")
                 else:
-                    print(manager.df.head(10).to_string(index=False))
+                    print(manager.head.to_string(index=False))
             elif choice == "3":
-                if manager.df.empty:
+                if not manager.has_data:
                     print("Load data first.")
                 else:
                     manager.build_students()
-                    print(f"Built {len(manager.students)} students.")
+                    print(f"Built {len(manager.summary)} students.")
             elif choice == "4":
-                if not manager.students:
+                if manager.summary.empty:
                     print("Build students first (option 3).")
                 else:
                     print(manager.student_summary_df().to_string(index=False))
             elif choice == "5":
-                if not manager.students:
+                if manager.summary.empty:
                     print("Build students first (option 3).")
                 else:
                     create_dashboard(manager)
                     print(f"Dashboard saved to {DASHBOARD_PNG}")
             elif choice == "6":
-                if manager.df.empty:
+                if not manager.has_data:
                     print("No data loaded.")
                 else:
-                    export_outputs(manager)
-                    print("Outputs exported to output/ folder.")
+                    method = input("Compress CSVs? (gzip/zstd, blank = none): ").strip().lower() or None
+                    fmt = input("Also write columnar copy? (npz/parquet, blank = no): ").strip().lower() or None
+                    for entry in export_outputs(manager, compression=method, columnar=fmt):
+                        print(f"{entry['path']}: {entry['bytes']:,} bytes in {entry['seconds']:.3f}s")
             elif choice == "7":
                 # quick run with sample
-                manager.load_csv(SAMPLE_CSV)
+                manager.load_csv(SAMPLE_CSV, use_cache=True)
                 manager.build_students()
                 export_outputs(manager)
                 create_dashboard(manager)
                 print("Quick run completed. Check output/ folder.")
+            elif choice == "8":
+                if manager.summary.empty:
+                    print("Build students first (option 3).")
+                else:
+                    roll = input("Enter Roll No: ").strip()
+                    try:
+                        r = manager.rank_report(roll)
+                    except KeyError:
+                        print("Roll No not found.")
+                    else:
+                        print(f"{roll}: rank {r['Rank']} of {r['Of']}, avg {r['Average']:.2f}, "
+                              f"percentile {r['Percentile']:.2f}")
+                        print(f"Top 10% cut-off: {manager.ranking.cutoff(10):.2f}")
+            elif choice == "9":
+                if not manager.has_data:
+                    print("Load data first (option 1).")
+                else:
+                    path = Path(input("Enter CSV path with new marks: ").strip())
+                    result = manager.append_csv(path)
+                    print(f"Appended {result['rows']} rows; {result['students']} students updated "
+                          f"({result['new_students']} new).")
+                    export_appended(manager)
+            elif choice == "10":
+                source = input("Enter folder or glob (e.g. data/sem*/*.csv): ").strip()
+                report = manager.load_many(source)
+                for entry in report:
+                    status = entry["error"] or f"{entry['kept']} kept, {entry['rejected']} rejected"
+                    print(f"{entry['file']}: {status} ({entry['seconds']:.2f}s)")
+                print(f"Loaded {len(manager.df)} rows from {len(report)} files.")
+            elif choice == "11":
+                if manager.df.empty:
+                    print("Load a whole dataset first (option 1 without chunking, or 10).")
+                else:
+                    by = input("Group by column (default: Semester): ").strip() or "Semester"
+                    results = create_group_dashboards(manager, by=by)
+                    print(f"Saved {len(results)} dashboards to {Path(results[0][0]).parent}" if results
+                          else "No groups found.")
             elif choice == "0":
                 print("Goodbye.")
                 break
             else:
                 print("Invalid choice.")
         except Exception as e:
-            logging.exception("An error occurred during operation.")
+            logger.exception("An error occurred during operation.")
+        if PROFILER is not None and PROFILER.records:
+            PROFILER.write_report()
 
 if __name__ == "__main__":
-    run_cli()
+    run_cli(profile=True if "--profile" in sys.argv[1:] else None)
     
 
 
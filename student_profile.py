@@ -1,97 +1,255 @@
-# ----------------------------- 
-# Welcome Section 
-# ----------------------------- 
-print("\n" + "="*60) 
-print("🎓 Welcome to Student Profile Generator CLI") 
-print("="*60) 
-print("This tool will collect your details and generate your profile card.") 
-print("You will also learn Python basics like:\n- Variables\n- Data Types\n- Operators\n- String Functions\n- File Handling\n") 
-# ----------------------------- 
-# Task 2: Input & Variables 
-# ----------------------------- 
-full_name = input("Enter your full name: ") 
-roll_no = input("Enter your roll number: ") 
-program = input("Enter your program (e.g., BCA): ") 
-university = input("Enter your university name: ") 
-city = input("Enter your city: ") 
-age = int(input("Enter your age: "))  # type conversion 
-hobby = input("Enter your hobby: ") 
-print("\n✅ Student Data Recorded Successfully!\n") 
-# ----------------------------- 
-# Task 3: Operators Demonstration 
-# ----------------------------- 
-print("="*60) 
-print("🔢 Python Operators Demonstration") 
-print("="*60) 
-num1 = float(input("Enter first number: ")) 
-num2 = float(input("Enter second number: ")) 
-# Arithmetic 
-print("\n-- Arithmetic Operations --") 
-print(f"{num1} + {num2} = {num1 + num2}") 
-print(f"{num1} - {num2} = {num1 - num2}") 
-print(f"{num1} * {num2} = {num1 * num2}") 
-print(f"{num1} / {num2} = {num1 / num2}") 
-print(f"{num1} % {num2} = {num1 % num2}") 
-print(f"{num1} ** {num2} = {num1 ** num2}") 
-print(f"{num1} // {num2} = {num1 // num2}") 
-# Assignment Operators 
-a = num1 
-a += 5 
-print("\n-- Assignment Operator Example --") 
-print(f"num1 += 5 → {a}") 
-# Comparison 
-print("\n-- Comparison Operators --") 
-print(f"{num1} > {num2} : {num1 > num2}") 
-print(f"{num1} == {num2} : {num1 == num2}") 
-# Logical 
-print("\n-- Logical Operators --") 
-print(f"({num1} > {num2}) and ({num1} != {num2}) : {(num1 > num2) and (num1 != 
-num2)}") 
-# Identity 
-print("\n-- Identity Operators --") 
-print(f"num1 is num2 : {num1 is num2}") 
-# Membership 
-print("\n-- Membership Operators --") 
-sample_string = full_name.lower() 
-print(f"'a' in your name? : {'a' in sample_string}") 
-# ----------------------------- 
-# Task 4: String Operations 
-# ----------------------------- 
-print("\n" + "="*60) 
-print("🔤 String Formatting & Methods Demo") 
-print("="*60) 
-print("Uppercase name:", full_name.upper()) 
-print("Lowercase name:", full_name.lower()) 
-print("Title case name:", full_name.title()) 
-print("Name length:", len(full_name)) 
-print("Replace a with @:", full_name.replace("a", "@")) 
-# ----------------------------- 
-# Task 5: Profile Card Output 
-# ----------------------------- 
-print("\n" + "-"*60) 
-print(" STUDENT PROFILE SYSTEM") 
-print("-"*60) 
-print(f"Name:            {full_name}") 
-print(f"Roll No:         {roll_no}") 
-print(f"Course:          {program}") 
-print(f"University:      {university}") 
-print(f"City:            {city}") 
-print(f"Age:             {age}") 
-print(f"Hobby:           {hobby}") 
-print("-"*60) 
-print("Welcome to Python Programming! ✅") 
-print("-"*60) 
-# ----------------------------- 
-# Task 6: Save Profile (Bonus) 
-# ----------------------------- 
-save = input("\nDo you want to save your profile? (yes/no): ").lower()
-if save == "yes":
-    with open("student_profile.txt", "w") as file:
-        file.write("STUDENT PROFILE\n")
-        file.write("-" * 50 + "\n")
-        file.write(f"Name: {full_name}\nRoll No: {roll_no}\nCourse: {program}\nUniversity: {university}\nCity: {city}\nAge: {age}\nHobby: {hobby}\n")
-        file.write("-" * 50)
-    print("\n✅ Profile saved to student_profile.txt")
-else:
-    print("\n✅ Profile not saved.")
-    print("\n🎯 Thank you for using this program!")
+"""Student Profile Generator.
+
+Run without arguments for the interactive walkthrough. For a whole intake,
+render every card from a roster CSV in one go:
+
+    python student_profile.py --roster roster.csv --out cards.txt
+    python student_profile.py --roster roster.csv --out cards.zip --workers 4
+
+The card itself is render_profile_card(profile), so other scripts can
+import it.
+"""
+import argparse
+import csv
+import io
+import os
+import sys
+import zipfile
+from collections import deque
+from itertools import islice
+
+# -----------------------------
+# Profile card rendering
+# -----------------------------
+FIELDS = ["full_name", "roll_no", "program", "university", "city", "age", "hobby"]
+
+# Roster CSV headers accepted for each field (compared case-insensitively).
+ROSTER_HEADERS = {
+    "full_name": ("full_name", "name", "full name", "student_name"),
+    "roll_no": ("roll_no", "roll no", "roll_number", "roll"),
+    "program": ("program", "course", "programme"),
+    "university": ("university", "college"),
+    "city": ("city",),
+    "age": ("age",),
+    "hobby": ("hobby", "hobbies"),
+}
+
+# Built once; rendering a card is a single format_map call.
+CARD_TEMPLATE = "\n".join([
+    "-" * 60,
+    " STUDENT PROFILE SYSTEM",
+    "-" * 60,
+    "Name:            {full_name}",
+    "Roll No:         {roll_no}",
+    "Course:          {program}",
+    "University:      {university}",
+    "City:            {city}",
+    "Age:             {age}",
+    "Hobby:           {hobby}",
+    "-" * 60,
+    "Welcome to Python Programming! ✅",
+    "-" * 60,
+]) + "\n"
+
+SAVED_TEMPLATE = ("STUDENT PROFILE\n" + "-" * 50 + "\n"
+                  "Name: {full_name}\nRoll No: {roll_no}\nCourse: {program}\nUniversity: {university}\n"
+                  "City: {city}\nAge: {age}\nHobby: {hobby}\n" + "-" * 50)
+
+def render_profile_card(profile):
+    """Return the profile card text for a dict with the FIELDS keys."""
+    return CARD_TEMPLATE.format_map(profile)
+
+def render_saved_profile(profile):
+    """Return the text written to student_profile.txt."""
+    return SAVED_TEMPLATE.format_map(profile)
+
+# -----------------------------
+# Batch mode (roster CSV)
+# -----------------------------
+def roster_field_map(header):
+    """Map each field to its column in the roster header; missing fields map to None."""
+    lookup = {h.strip().lower(): h for h in header}
+    mapping = {}
+    for field, names in ROSTER_HEADERS.items():
+        mapping[field] = next((lookup[n] for n in names if n in lookup), None)
+    if mapping["full_name"] is None or mapping["roll_no"] is None:
+        raise ValueError("Roster needs at least a name and a roll number column.")
+    return mapping
+
+def _render_chunk(job):
+    """Worker: render a chunk of roster rows. Returns a list of (roll_no, card)."""
+    rows, mapping = job
+    render = CARD_TEMPLATE.format_map
+    out = []
+    for row in rows:
+        profile = {field: (row.get(col) or "").strip() if col else "" for field, col in mapping.items()}
+        out.append((profile["roll_no"], render(profile)))
+    return out
+
+def _card_name(roll_no, seen):
+    base = "".join(c if c.isalnum() or c in "-_." else "_" for c in roll_no) or "card"
+    name, n = base, 1
+    while name in seen:
+        n += 1
+        name = f"{base}_{n}"
+    seen.add(name)
+    return name + ".txt"
+
+def _rendered_chunks(reader, mapping, chunk_size, workers):
+    """Yield rendered chunks in roster order, keeping at most 2 x workers in flight."""
+    chunks = iter(lambda: list(islice(reader, chunk_size)), [])
+    if workers <= 1:
+        for rows in chunks:
+            yield _render_chunk((rows, mapping))
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for rows in chunks:
+            pending.append(pool.submit(_render_chunk, (rows, mapping)))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def render_roster(roster_csv, out_path, workers=None, chunk_size=5000):
+    """Render a card for every row of roster_csv.
+
+    Cards go into one combined text file, or into a zip archive (one
+    <roll_no>.txt per student) when out_path ends in .zip. Rows are read and
+    rendered in chunks, in parallel across worker processes for large
+    rosters, and written through a large buffer. Returns the number of cards.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    count = 0
+    with open(roster_csv, newline="", encoding="utf-8-sig") as src:
+        reader = csv.DictReader(src)
+        mapping = roster_field_map(reader.fieldnames or [])
+        chunks = _rendered_chunks(reader, mapping, chunk_size, workers)
+        if str(out_path).lower().endswith(".zip"):
+            seen = set()
+            with zipfile.ZipFile(out_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                for cards in chunks:
+                    for roll_no, card in cards:
+                        zf.writestr(_card_name(roll_no, seen), card)
+                    count += len(cards)
+        else:
+            with open(out_path, "w", encoding="utf-8", buffering=1 << 20) as out:
+                for cards in chunks:
+                    buf = io.StringIO()
+                    for _, card in cards:
+                        buf.write(card)
+                        buf.write("\n")
+                    out.write(buf.getvalue())
+                    count += len(cards)
+    return count
+
+# -----------------------------
+# Interactive walkthrough
+# -----------------------------
+def interactive():
+    # -----------------------------
+    # Welcome Section
+    # -----------------------------
+    print("\n" + "="*60)
+    print("🎓 Welcome to Student Profile Generator CLI")
+    print("="*60)
+    print("This tool will collect your details and generate your profile card.")
+    print("You will also learn Python basics like:\n- Variables\n- Data Types\n- Operators\n- String Functions\n- File Handling\n")
+    # -----------------------------
+    # Task 2: Input & Variables
+    # -----------------------------
+    full_name = input("Enter your full name: ")
+    roll_no = input("Enter your roll number: ")
+    program = input("Enter your program (e.g., BCA): ")
+    university = input("Enter your university name: ")
+    city = input("Enter your city: ")
+    age = int(input("Enter your age: "))  # type conversion
+    hobby = input("Enter your hobby: ")
+    print("\n✅ Student Data Recorded Successfully!\n")
+    # -----------------------------
+    # Task 3: Operators Demonstration
+    # -----------------------------
+    print("="*60)
+    print("🔢 Python Operators Demonstration")
+    print("="*60)
+    num1 = float(input("Enter first number: "))
+    num2 = float(input("Enter second number: "))
+    # Arithmetic
+    print("\n-- Arithmetic Operations --")
+    print(f"{num1} + {num2} = {num1 + num2}")
+    print(f"{num1} - {num2} = {num1 - num2}")
+    print(f"{num1} * {num2} = {num1 * num2}")
+    print(f"{num1} / {num2} = {num1 / num2}")
+    print(f"{num1} % {num2} = {num1 % num2}")
+    print(f"{num1} ** {num2} = {num1 ** num2}")
+    print(f"{num1} // {num2} = {num1 // num2}")
+    # Assignment Operators
+    a = num1
+    a += 5
+    print("\n-- Assignment Operator Example --")
+    print(f"num1 += 5 → {a}")
+    # Comparison
+    print("\n-- Comparison Operators --")
+    print(f"{num1} > {num2} : {num1 > num2}")
+    print(f"{num1} == {num2} : {num1 == num2}")
+    # Logical
+    print("\n-- Logical Operators --")
+    print(f"({num1} > {num2}) and ({num1} != {num2}) : {(num1 > num2) and (num1 != num2)}")
+    # Identity
+    print("\n-- Identity Operators --")
+    print(f"num1 is num2 : {num1 is num2}")
+    # Membership
+    print("\n-- Membership Operators --")
+    sample_string = full_name.lower()
+    print(f"'a' in your name? : {'a' in sample_string}")
+    # -----------------------------
+    # Task 4: String Operations
+    # -----------------------------
+    print("\n" + "="*60)
+    print("🔤 String Formatting & Methods Demo")
+    print("="*60)
+    print("Uppercase name:", full_name.upper())
+    print("Lowercase name:", full_name.lower())
+    print("Title case name:", full_name.title())
+    print("Name length:", len(full_name))
+    print("Replace a with @:", full_name.replace("a", "@"))
+    # -----------------------------
+    # Task 5: Profile Card Output
+    # -----------------------------
+    profile = {"full_name": full_name, "roll_no": roll_no, "program": program,
+               "university": university, "city": city, "age": age, "hobby": hobby}
+    print()
+    print(render_profile_card(profile), end="")
+    # -----------------------------
+    # Task 6: Save Profile (Bonus)
+    # -----------------------------
+    save = input("\nDo you want to save your profile? (yes/no): ").lower()
+    if save == "yes":
+        with open("student_profile.txt", "w", encoding="utf-8") as file:
+            file.write(render_saved_profile(profile))
+        print("\n✅ Profile saved to student_profile.txt")
+    else:
+        print("\n✅ Profile not saved.")
+        print("\n🎯 Thank you for using this program!")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Student Profile Generator")
+    parser.add_argument("--roster", help="roster CSV to render in batch (skips the interactive walkthrough)")
+    parser.add_argument("--out", default="student_profiles.txt", help="combined .txt or .zip archive")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args(argv)
+    if not args.roster:
+        interactive()
+        return
+    try:
+        count = render_roster(args.roster, args.out, workers=args.workers, chunk_size=args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ Rendered {count} profile cards to {args.out}")
+
+if __name__ == "__main__":
+    main()